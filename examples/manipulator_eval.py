@@ -4,6 +4,7 @@ during an evaluation of a robot manipulator.
 
 Usage: python examples/manipulator_eval.py --ip <robot_ip>
 """
+import os
 import tempfile
 
 import numpy as np
@@ -62,13 +63,18 @@ def main(_):
     """
     Set up the logger
     """
+    # in multi-process runs only rank 0 creates a wandb run and saves data
+    rank = int(os.environ.get("RANK", 0))
+
     # wandb logger
-    wandb_config = WandBLogger.get_default_config()
-    wandb_logger = WandBLogger(
-        wandb_config=wandb_config,
-        variant=FLAGS.flag_values_dict(),
-        debug=FLAGS.debug,
-    )
+    wandb_logger = None
+    if rank == 0:
+        wandb_config = WandBLogger.get_default_config()
+        wandb_logger = WandBLogger(
+            wandb_config=wandb_config,
+            variant=FLAGS.flag_values_dict(),
+            debug=FLAGS.debug,
+        )
 
     # frames visualizer
     frames_visualizer = FrameVisualizer(
@@ -81,10 +87,12 @@ def main(_):
     # data_saver = LocalStorage(
     # storage_dir=tempfile.gettempdir(),
     # )
-    data_saver = HuggingFaceStorage(
-        storage_dir=tempfile.gettempdir(),
-        repo_id="zhouzypaul/eval_logger",
-    )
+    data_saver = None
+    if rank == 0:
+        data_saver = HuggingFaceStorage(
+            storage_dir=tempfile.gettempdir(),
+            repo_id="zhouzypaul/eval_logger",
+        )
 
     # create the eval logger
     eval_logger = EvalLogger(
@@ -92,6 +100,7 @@ def main(_):
         frames_visualizer=frames_visualizer,
         data_saver=data_saver,
         log_step_stats_interval_minutes=None,  # frequent logging for testing
+        rank=rank,
     )
 
     """
@@ -1,13 +1,20 @@
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
 import wandb
 
 from robot_eval_logger.storage import BaseSaver, LocalStorage
 from robot_eval_logger.time import TimeLogger
-from robot_eval_logger.typing import *
+from robot_eval_logger.typing import (
+    ControlMode,
+    StepData,
+    TrajData,
+    step_data_sequence_to_traj_data,
+)
 
 
 class EvalLogger:
@@ -30,13 +37,42 @@ class EvalLogger:
         frames_visualizer=None,
         data_saver: Optional[BaseSaver] = None,
         log_step_stats_interval_minutes: Optional[float] = None,
+        async_frame_rendering: bool = False,
+        rank: int = 0,
     ):
+        # in multi-process (e.g. multi-GPU) evals only rank 0 logs and saves;
+        # every public method is a no-op on the other ranks. Callers should also
+        # only construct the WandBLogger (which calls wandb.init) and the data
+        # saver on rank 0, passing None on the other ranks
+        self.rank = rank
         self.wandb_logger = wandb_logger
         self.frames_visualizer = frames_visualizer
         self.data_saver = data_saver
 
+        # optionally render frame visualizations (resize, video encode, plots) on a
+        # background thread so it overlaps the next rollout; results are pushed to
+        # wandb from the calling thread, since wandb is not thread-safe
+        self._render_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_render: Optional[Tuple[Future, int]] = None  # (future, episode)
+        if async_frame_rendering and frames_visualizer is not None and rank == 0:
+            self._render_executor = ThreadPoolExecutor(max_workers=1)
+        # the worker gets a snapshot of only the success history it can plot (the
+        # last success_viz_every_n entries), so each episode copies O(n) values
+        viz_every_n = getattr(frames_visualizer, "success_viz_every_n", None)
+        self._render_success_history = (
+            viz_every_n if isinstance(viz_every_n, int) and viz_every_n > 0 else None
+        )
+
         self.past_success_rates = {}  # prefix --> list of success data points
+        # running success statistics, updated in O(1) per episode
+        self._success_sum: Dict[str, float] = {}  # prefix --> sum of all successes
+        self._recent_success: Dict[str, deque] = {}  # prefix --> last 20 successes
+        self._recent_success_sum: Dict[str, float] = {}  # prefix --> sum of above
+        # wandb keys built once and reused every episode
+        self._success_keys: Dict[str, Tuple[str, str, str, str]] = {}  # prefix --> keys
+        self._key_cache: Dict[Tuple[str, Tuple[str, ...]], Dict[str, str]] = {}
         self.metadata_saved = False
+        self._defined_prefixes = set()  # prefixes already bound to num_episode
 
         # episode tracking
         self.current_episode = 0
@@ -49,6 +85,7 @@ class EvalLogger:
         if (
             self.wandb_logger is not None
             and log_step_stats_interval_minutes is not None
+            and rank == 0
         ):
             self._time_logger = TimeLogger(
                 wandb_logger, log_step_stats_interval_minutes
@@ -87,6 +124,9 @@ class EvalLogger:
             policy_id: ``TrajData.policy_id`` (checkpoint, run id, etc.).
             **kwargs: Extra episode-level keys for ``TrajData``.
         """
+        if self.rank != 0:
+            return {}
+
         i_episode = self.current_episode
 
         if viz_logging_prefix is None:
@@ -123,7 +163,20 @@ class EvalLogger:
                 logging_prefix=viz_logging_prefix,
                 episode_success=episode_success,
             )
-            if self.frames_visualizer is not None:
+            if self._render_executor is not None:
+                # at most one render in flight: log the previous episode's
+                # visualization before queueing this one
+                self._log_pending_render()
+                future = self._render_executor.submit(
+                    self.frames_visualizer.log_frames,
+                    step=i_episode,
+                    logging_prefix=viz_logging_prefix,
+                    frames=frames_to_log,
+                    success_rates=self._success_history_snapshot(viz_logging_prefix),
+                )
+                self._pending_render = (future, i_episode)
+                frames_viz = {}
+            elif self.frames_visualizer is not None:
                 frames_viz = self.frames_visualizer.log_frames(
                     step=i_episode,
                     logging_prefix=viz_logging_prefix,
@@ -132,11 +185,15 @@ class EvalLogger:
                 )
             else:
                 frames_viz = {}
-            others = {f"{viz_logging_prefix}/{k}": v for k, v in kwargs.items()}
+            others = self._prefix_kwargs(viz_logging_prefix, kwargs)
             to_log = {**frames_viz, **success_stats, **others}
 
-            for k in to_log.keys():
-                wandb.define_metric(f"{k}/*", step_metric="num_episode")
+            if viz_logging_prefix not in self._defined_prefixes:
+                # one glob covers every key logged under this prefix
+                wandb.define_metric(
+                    f"{viz_logging_prefix}/*", step_metric="num_episode"
+                )
+                self._defined_prefixes.add(viz_logging_prefix)
             self.wandb_logger.log({**to_log, "num_episode": i_episode})
 
         # save the trajectory data
@@ -157,6 +214,31 @@ class EvalLogger:
 
         return to_log
 
+    def _log_pending_render(self):
+        """Wait for the in-flight background render, if any, and log its output."""
+        if self._pending_render is None:
+            return
+        future, i_episode = self._pending_render
+        self._pending_render = None
+        try:
+            frames_viz = future.result()
+        except Exception as e:
+            # a failed visualization is dropped; it must never block the
+            # episode save or storage flush the caller still has to do
+            print(f"Error rendering frames for episode {i_episode}: {e}")
+            return
+        if frames_viz:
+            self.wandb_logger.log({**frames_viz, "num_episode": i_episode})
+
+    def _prefix_kwargs(self, logging_prefix: str, kwargs: dict) -> dict:
+        """Return ``{f"{logging_prefix}/{k}": v}``, reusing the keys built last time."""
+        cache_key = (logging_prefix, tuple(kwargs))
+        keys = self._key_cache.get(cache_key)
+        if keys is None:
+            keys = {k: f"{logging_prefix}/{k}" for k in kwargs}
+            self._key_cache[cache_key] = keys
+        return {keys[k]: v for k, v in kwargs.items()}
+
     def _reset_new_episode(self):
         self._current_episode_steps = []
         self._episode_wall_start = None
@@ -191,6 +273,9 @@ class EvalLogger:
         joint_effort: Optional[np.ndarray] = None,
     ):
         """Log one transition: multi-camera images, state, and action."""
+        if self.rank != 0:
+            return
+
         if not self._step_input_check_passed:
             self._check_step_inputs(
                 obs,
@@ -237,6 +322,8 @@ class EvalLogger:
         evaluator_name: Optional[str] = None,
         eval_name: Optional[str] = None,
     ):
+        if self.rank != 0:
+            return
         self.metadata_saved = True
         if self.data_saver:
             self.data_saver.save_metadata(
@@ -255,32 +342,53 @@ class EvalLogger:
         episode_success,
     ):
         """visualizes success rate metrics"""
-        # save episode success
+        success = float(episode_success)
+
+        # save episode success (the full history is used by the frames visualizer)
         if logging_prefix not in self.past_success_rates:
             self.past_success_rates[logging_prefix] = []
-        self.past_success_rates[logging_prefix].append(float(episode_success))
+            self._success_sum[logging_prefix] = 0.0
+            self._recent_success[logging_prefix] = deque(maxlen=20)
+            self._recent_success_sum[logging_prefix] = 0.0
+            self._success_keys[logging_prefix] = (
+                f"{logging_prefix}/episode_success",
+                f"{logging_prefix}/cumulative_num_success",
+                f"{logging_prefix}/recent_success_rate",
+                f"{logging_prefix}/overall_success_rate",
+            )
+        self.past_success_rates[logging_prefix].append(success)
+
+        # update running sums; the recent window drops its oldest entry when full
+        recent = self._recent_success[logging_prefix]
+        if len(recent) == recent.maxlen:
+            self._recent_success_sum[logging_prefix] -= recent[0]
+        recent.append(success)
+        self._recent_success_sum[logging_prefix] += success
+        self._success_sum[logging_prefix] += success
 
         # success rates - round to 4 decimal places for precision
+        num_episodes = len(self.past_success_rates[logging_prefix])
         recent_success_rate = round(
-            np.mean(self.past_success_rates[logging_prefix][-20:]), 4
+            self._recent_success_sum[logging_prefix] / len(recent), 4
         )
         overall_success_rate = round(
-            np.mean(self.past_success_rates[logging_prefix]), 4
+            self._success_sum[logging_prefix] / num_episodes, 4
         )
 
         # log
+        success_key, cumulative_key, recent_key, overall_key = self._success_keys[
+            logging_prefix
+        ]
         to_log = {
-            f"{logging_prefix}/episode_success": float(episode_success),
-            f"{logging_prefix}/cumulative_num_success": sum(
-                self.past_success_rates[logging_prefix]
-            ),
-            f"{logging_prefix}/recent_success_rate": recent_success_rate,
-            f"{logging_prefix}/overall_success_rate": overall_success_rate,
+            success_key: success,
+            cumulative_key: self._success_sum[logging_prefix],
+            recent_key: recent_success_rate,
+            overall_key: overall_success_rate,
         }
         return to_log
 
     def stop_time_logging(self):
-        """Safely stop the time logging thread."""
+        """Stop periodic step-throughput logging."""
         if self._time_logger is not None:
             self._time_logger.stop()
 
@@ -289,25 +397,52 @@ class EvalLogger:
 
         Safe to call multiple times.  Call this before exiting to ensure
         no trajectory data is lost when ``StorageConfig.async_saving``
-        or ``StorageConfig.batch_hf_uploads`` are enabled.
+        or ``StorageConfig.batch_hf_uploads`` are enabled.  Also logs the
+        last background frame render when ``async_frame_rendering`` is on.
         """
-        if self.data_saver is not None:
-            self.data_saver.flush()
+        if self.rank != 0:
+            return
+        try:
+            self._log_pending_render()
+        finally:
+            if self.data_saver is not None:
+                self.data_saver.flush()
 
     def __del__(self):
-        """Clean up the time logging & saving thread when the logger is destroyed and log any remaining frames"""
+        """Flush pending saves, stop time logging, and log any remaining frames when the logger is destroyed"""
+        # getattr: __init__ may have raised before these were set
+        if getattr(self, "rank", 0) != 0:
+            return
         try:
-            self._visualize_remaining_frames()
-            self.flush()
-            self.stop_time_logging()
+            try:
+                self._visualize_remaining_frames()
+            finally:
+                # pending saves / batched uploads are flushed even if the final
+                # visualization fails
+                self.flush()
+                self.stop_time_logging()
         except Exception as e:
             print(f"Error in EvalLogger.__del__: {e}")
             pass  # ignore any errors during cleanup
+        if getattr(self, "_render_executor", None) is not None:
+            self._render_executor.shutdown(wait=False)
+            self._render_executor = None
+
+    def _success_history_snapshot(self, logging_prefix: str) -> list:
+        """Copy of the success history handed to the async render worker."""
+        history = self.past_success_rates[logging_prefix]
+        if self._render_success_history is None:
+            return list(history)  # visualizer without success_viz_every_n
+        return history[-self._render_success_history :]
 
     def _visualize_remaining_frames(self):
         """Log any remaining frames that haven't been logged due to not reaching the periodic threshold"""
         if self.frames_visualizer is None:
             return
+        self._log_pending_render()
+        # visualizers without pending_count always get log_remaining_frames
+        if getattr(self.frames_visualizer, "pending_count", None) == 0:
+            return
 
         # Log the remaining frames (current_episode is next index; last logged is one less)
         final_episode_index = (
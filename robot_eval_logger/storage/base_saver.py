@@ -2,7 +2,7 @@ import os
 from dataclasses import dataclass
 from typing import Optional, Union
 
-from robot_eval_logger.typing import *
+from robot_eval_logger.typing import ControlMode, TrajData
 from robot_eval_logger.utils import make_eval_id_and_timestamp
 
 
@@ -12,14 +12,20 @@ class StorageConfig:
 
     # ~10-15x reduction in image size via JPEG encoding.
     # Slight CPU cost per image (~1-2 ms each); easily offset by smaller I/O.
+    # Uses simplejpeg (libjpeg-turbo) when installed, Pillow otherwise.
     compress_images: bool = True
 
     # JPEG quality (1-100). Lower = smaller files but more compression artifacts.
     image_quality: int = 90
 
+    # Codec used when ``compress_images`` is on: "jpeg" (lossy, ~10-15x smaller)
+    # or "png" (lossless, typically ~2-3x smaller and slower to encode).
+    # Both are decoded by ``TrajData.decode_images``.
+    image_format: str = "jpeg"
+
     # Stacks per-step List[np.ndarray] into contiguous (T, D) arrays.
     # Reduces pickle per-object overhead by ~5-10% and improves compressibility.
-    # Negligible CPU cost.
+    # Negligible CPU cost. Trajectories from EvalLogger are already stacked.
     stack_arrays: bool = True
 
     # Wraps the pickle in lz4 frame compression.
@@ -42,6 +48,16 @@ class StorageConfig:
     # overhead (one commit vs. N commits). Metadata is still uploaded eagerly.
     batch_hf_uploads: bool = False
 
+    # (HuggingFaceStorage only, with ``batch_hf_uploads``) Commit the queue as
+    # soon as this many episodes are pending, or when an episode is saved and
+    # the oldest pending one was queued ``hf_batch_interval_s`` or more seconds
+    # ago, instead of holding everything until ``flush()``. Both triggers are
+    # only checked in ``save_episode``: no timer fires during a pause, so call
+    # ``flush()`` before a long break. Commits run on the background saver
+    # thread when ``async_saving`` is on. ``None`` disables the trigger.
+    hf_batch_size: Optional[int] = None
+    hf_batch_interval_s: Optional[float] = None
+
 
 class BaseSaver:
     def __init__(self, storage_dir, config: Optional[StorageConfig] = None):
@@ -61,8 +77,7 @@ class BaseSaver:
 
     def make_save_dir(self):
         save_dir = os.path.join(self.storage_dir, str(self.eval_id.id))
-        if not os.path.exists(save_dir):
-            os.makedirs(save_dir)
+        os.makedirs(save_dir, exist_ok=True)
         print(f"Specific run dir is {save_dir}")
         self.run_dir = save_dir
         return save_dir
@@ -6,12 +6,9 @@ import os
 import time
 from typing import List, Optional, Tuple, Union
 
-from huggingface_hub import CommitOperationAdd, HfApi
-from huggingface_hub.errors import HfHubHTTPError, RepositoryNotFoundError
-
 from robot_eval_logger.storage.base_saver import StorageConfig
 from robot_eval_logger.storage.local import LocalStorage
-from robot_eval_logger.typing import *
+from robot_eval_logger.typing import ControlMode, TrajData
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +29,11 @@ class HuggingFaceStorage(LocalStorage):
             - traj_1.pkl
             ...
 
-    When ``StorageConfig.batch_hf_uploads`` is True (default), episode files are
-    queued and committed to HuggingFace in a single API call during ``flush()``.
+    When ``StorageConfig.batch_hf_uploads`` is True, episode files are queued
+    and committed to HuggingFace in a single API call during ``flush()``, or
+    earlier when ``save_episode`` finds ``hf_batch_size`` / ``hf_batch_interval_s``
+    reached. Nothing is committed between episodes, so a queue left during a
+    pause waits for the next episode or ``flush()``.
     This replaces N HTTP round-trips with one, dramatically reducing upload
     overhead for multi-episode evals.
     """
@@ -52,12 +52,20 @@ class HuggingFaceStorage(LocalStorage):
             hf_dir_name (str, optional): Directory name in the Hugging Face repository
             config (StorageConfig, optional): Storage optimizations configs
         """
+        # imported here so LocalStorage-only users never load huggingface_hub
+        from huggingface_hub import HfApi, get_token
+
         super().__init__(storage_dir, config)
         self.repo_id = repo_id
         self.hf_dir_name = hf_dir_name
-        self.api = HfApi()
+        # resolve the login token once rather than on every request
+        self.api = HfApi(token=get_token())
+        # set once the repo is known to be missing / inaccessible; retrying
+        # cannot fix that, so later uploads fail fast instead of backing off
+        self._repo_not_found = False
         # (local_path, repo_path, episode_index) tuples queued for batch upload
         self._pending_hf_uploads: List[Tuple[str, str, int]] = []
+        self._batch_started_at: Optional[float] = None
 
     def _upload_to_hf(
         self,
@@ -77,21 +85,29 @@ class HuggingFaceStorage(LocalStorage):
         Returns:
             bool: True if upload was successful, False otherwise
         """
+        if self._repo_not_found:
+            return False
+
+        from huggingface_hub.errors import HfHubHTTPError, RepositoryNotFoundError
+
         retry_count = 0
         while retry_count < max_retries:
             try:
-                with open(file_path, "rb") as f:
-                    self.api.upload_file(
-                        path_or_fileobj=f,
-                        path_in_repo=path_in_repo,
-                        repo_id=self.repo_id,
-                        repo_type="dataset",
-                        commit_message=commit_message,
-                    )
+                # pass the path so HfApi manages the file handle (and can
+                # re-open it if the upload is retried internally)
+                self.api.upload_file(
+                    path_or_fileobj=file_path,
+                    path_in_repo=path_in_repo,
+                    repo_id=self.repo_id,
+                    repo_type="dataset",
+                    commit_message=commit_message,
+                )
                 return True
+            except RepositoryNotFoundError as e:
+                self._handle_repo_not_found(e)
+                return False
             except (
                 HfHubHTTPError,
-                RepositoryNotFoundError,
                 ConnectionError,
                 TimeoutError,
             ) as e:
@@ -111,21 +127,37 @@ class HuggingFaceStorage(LocalStorage):
         )
         return False
 
-    def _batch_upload_to_hf(self, max_retries: int = 3) -> bool:
-        """Commit all queued episode files in one HF API call.
+    def _handle_repo_not_found(self, e: Exception):
+        self._repo_not_found = True
+        logger.error(
+            f"HF repo {self.repo_id} not found or not accessible, skipping all "
+            f"further uploads (data is still saved locally): {e}"
+        )
+
+    def _batch_upload_to_hf(
+        self, uploads: List[Tuple[str, str, int]], max_retries: int = 3
+    ) -> bool:
+        """Commit all ``uploads`` in one HF API call.
         Falls back to individual uploads on failure.
 
         Returns:
             bool: True if upload was successful, False otherwise
         """
-        if not self._pending_hf_uploads:
+        if not uploads:
             return True
+        if self._repo_not_found:
+            return False
+
+        from huggingface_hub import CommitOperationAdd
+        from huggingface_hub.errors import HfHubHTTPError, RepositoryNotFoundError
 
         operations = [
             CommitOperationAdd(path_in_repo=repo_path, path_or_fileobj=local_path)
-            for local_path, repo_path, _ in self._pending_hf_uploads
+            for local_path, repo_path, _ in uploads
         ]
         n = len(operations)
+        episodes = [i_ep for _, _, i_ep in uploads]
+        commit_message = f"Upload {n} episodes ({min(episodes)}-{max(episodes)})"
         retry_count = 0
         while retry_count < max_retries:
             try:
@@ -133,13 +165,15 @@ class HuggingFaceStorage(LocalStorage):
                     repo_id=self.repo_id,
                     repo_type="dataset",
                     operations=operations,
-                    commit_message=f"Upload {n} episodes",
+                    commit_message=commit_message,
                 )
                 logger.info(f"Batch-uploaded {n} episodes to HuggingFace")
                 return True
+            except RepositoryNotFoundError as e:
+                self._handle_repo_not_found(e)
+                return False
             except (
                 HfHubHTTPError,
-                RepositoryNotFoundError,
                 ConnectionError,
                 TimeoutError,
             ) as e:
@@ -155,7 +189,7 @@ class HuggingFaceStorage(LocalStorage):
 
         logger.warning("Batch upload failed; falling back to individual uploads")
         all_ok = True
-        for local_path, repo_path, i_ep in self._pending_hf_uploads:
+        for local_path, repo_path, i_ep in uploads:
             ok = self._upload_to_hf(local_path, repo_path, f"Upload episode {i_ep}")
             all_ok = all_ok and ok
         return all_ok
@@ -201,8 +235,9 @@ class HuggingFaceStorage(LocalStorage):
     def save_episode(self, i_episode: int, traj: TrajData):
         """Save ``traj`` locally, then upload (or queue) for HuggingFace.
 
-        When ``config.batch_hf_uploads`` is True the upload is deferred to
-        ``flush()``.
+        When ``config.batch_hf_uploads`` is True the upload is queued and
+        committed by the first ``save_episode`` call that finds the batch full
+        (see ``hf_batch_size`` / ``hf_batch_interval_s``), or on ``flush()``.
         """
         file_path = os.path.join(self.run_dir, f"traj_{i_episode}.pkl")
         path_in_repo = os.path.join(
@@ -212,10 +247,15 @@ class HuggingFaceStorage(LocalStorage):
         if self.config.batch_hf_uploads:
             # save locally but don't upload to hf yet
             super().save_episode(i_episode, traj)
+            if not self._pending_hf_uploads:
+                self._batch_started_at = time.time()
             self._pending_hf_uploads.append((file_path, path_in_repo, i_episode))
+            if self._batch_is_full():
+                self._commit_pending_batch()
         else:
             # save locally and upload to hf
             if self.config.async_saving:
+                self._reap_finished_saves()
                 future = self._executor.submit(
                     self._save_and_upload, file_path, traj, path_in_repo, i_episode
                 )
@@ -225,6 +265,35 @@ class HuggingFaceStorage(LocalStorage):
 
         return file_path
 
+    def _batch_is_full(self) -> bool:
+        """Whether the pending queue has hit the size or age trigger.
+
+        Only evaluated from ``save_episode``; the age is not watched in between.
+        """
+        batch_size = self.config.hf_batch_size
+        interval_s = self.config.hf_batch_interval_s
+        if batch_size is not None and len(self._pending_hf_uploads) >= batch_size:
+            return True
+        return (
+            interval_s is not None
+            and self._batch_started_at is not None
+            and time.time() - self._batch_started_at >= interval_s
+        )
+
+    def _commit_pending_batch(self):
+        """Hand the pending queue off to a batch commit.
+
+        The commit is submitted to the same single-worker executor as the local
+        saves, so it always runs after the pickles it references are written.
+        """
+        batch, self._pending_hf_uploads = self._pending_hf_uploads, []
+        self._batch_started_at = None
+        if self.config.async_saving:
+            future = self._executor.submit(self._batch_upload_to_hf, batch)
+            self._pending_futures.append(future)
+        else:
+            self._batch_upload_to_hf(batch)
+
     def _save_and_upload(
         self, file_path: str, traj: TrajData, path_in_repo: str, i_episode: int
     ):
@@ -242,5 +311,6 @@ class HuggingFaceStorage(LocalStorage):
         super().flush()
 
         if self.config.batch_hf_uploads and self._pending_hf_uploads:
-            self._batch_upload_to_hf()
+            self._batch_upload_to_hf(self._pending_hf_uploads)
             self._pending_hf_uploads.clear()
+            self._batch_started_at = None
@@ -4,7 +4,7 @@ from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional, Union
 
 from robot_eval_logger.storage.base_saver import BaseSaver, StorageConfig
-from robot_eval_logger.typing import *
+from robot_eval_logger.typing import ControlMode, MetaData, RobotType, TrajData
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +30,7 @@ class LocalStorage(BaseSaver):
         super().__init__(storage_dir, config)
         self._executor: Optional[ThreadPoolExecutor] = None
         self._pending_futures: List[Future] = []
+        self._save_errors: List[BaseException] = []
         if self.config.async_saving:
             self._executor = ThreadPoolExecutor(max_workers=1)
 
@@ -68,10 +69,10 @@ class LocalStorage(BaseSaver):
         )
 
         metadata_path = os.path.join(self.run_dir, "metadata.json")
-        if os.path.exists(metadata_path):
-            raise ValueError(f"metadata already exists at {metadata_path}")
-
-        metadata.save(metadata_path)
+        try:
+            metadata.save(metadata_path, exclusive=True)
+        except FileExistsError:
+            raise ValueError(f"metadata already exists at {metadata_path}") from None
         return metadata_path
 
     def save_episode(self, i_episode: int, traj: TrajData):
@@ -82,6 +83,7 @@ class LocalStorage(BaseSaver):
         """
         file_path = os.path.join(self.run_dir, f"traj_{i_episode}.pkl")
         if self.config.async_saving:
+            self._reap_finished_saves()
             future = self._executor.submit(self._do_save, file_path, traj)
             self._pending_futures.append(future)
         else:
@@ -94,17 +96,33 @@ class LocalStorage(BaseSaver):
             file_path,
             compress_images=self.config.compress_images,
             image_quality=self.config.image_quality,
+            image_format=self.config.image_format,
             stack_arrays=self.config.stack_arrays,
             compress_pickle=self.config.compress_pickle,
             use_highest_pickle_protocol=self.config.use_highest_pickle_protocol,
         )
 
+    def _reap_finished_saves(self):
+        """Drop completed saves from the pending list.
+
+        Failures are logged as soon as they are noticed rather than only at
+        ``flush()``, and kept so that ``flush()`` still re-raises them.
+        """
+        still_pending = []
+        for future in self._pending_futures:
+            if not future.done():
+                still_pending.append(future)
+            elif future.exception() is not None:
+                logger.error(f"Background save failed: {future.exception()}")
+                self._save_errors.append(future.exception())
+        self._pending_futures = still_pending
+
     def flush(self):
         """Block until every queued background save has finished.
 
         Re-raises the first exception from any failed save.
         """
-        errors = []
+        errors, self._save_errors = self._save_errors, []
         for future in self._pending_futures:
             try:
                 future.result()
@@ -1,55 +1,53 @@
 import time
-from threading import Event, Thread, current_thread
 from typing import Optional
 
 import wandb
 
 
 class TimeLogger:
-    """Periodically logs step-throughput statistics to wandb in a background thread."""
+    """Periodically logs step-throughput statistics to wandb.
+
+    The interval check piggybacks on :meth:`record_step`, so stats are pushed
+    from the eval loop's own thread (wandb is not thread-safe) and no
+    background thread is needed.
+    """
 
     def __init__(self, wandb_logger, interval_minutes: float):
         self._wandb_logger = wandb_logger
-        self._interval_minutes = interval_minutes
+        self._interval_seconds = interval_minutes * 60
 
-        self.total_steps = 0
         self.steps_since_last_log = 0
+        self._steps_logged = 0  # steps already folded into a logged stat
         self.time_elapsed = 0.0
         self.last_log_time: Optional[float] = None
+        self._metric_defined = False
 
-        self._stop_event = Event()
-        self._thread: Optional[Thread] = None
+        self._running = False
 
     def start(self):
-        """Start the periodic logging background thread."""
-        if self._thread is None:
-            self._stop_event.clear()
-            self._thread = Thread(target=self._run, daemon=True)
-            self._thread.start()
+        """Start the logging clock; stats are first logged one interval later."""
+        if not self._running:
+            self._running = True
+            if self.last_log_time is None:
+                self._log_stats()  # the first call only initializes the clock
 
     def stop(self):
-        """Safely stop the background thread."""
-        if self._thread is not None and self._thread.is_alive():
-            self._stop_event.set()
-            if self._thread != current_thread():
-                self._thread.join(timeout=1.0)
-            self._thread = None
+        """Stop logging stats; :meth:`record_step` keeps counting steps."""
+        self._running = False
+
+    @property
+    def total_steps(self) -> int:
+        return self._steps_logged + self.steps_since_last_log
 
     def record_step(self):
-        """Increment step counters (call once per eval step)."""
-        self.total_steps += 1
+        """Increment the step counter (call once per eval step) and log if due."""
         self.steps_since_last_log += 1
-
-    def _run(self):
-        """Background loop that calls :meth:`_log_stats` at the configured interval."""
-        while not self._stop_event.is_set():
+        if self._running and time.time() - self.last_log_time >= self._interval_seconds:
             try:
                 self._log_stats()
             except Exception as e:
                 print(f"Error in periodic logging: {e}")
-                break
-            self._stop_event.wait(timeout=self._interval_minutes * 60)
-        self._thread = None
+                self.stop()
 
     def _log_stats(self):
         """Compute and push time-related metrics to wandb."""
@@ -62,18 +60,19 @@ class TimeLogger:
         minutes_elapsed = (current_time - self.last_log_time) / 60.0
         self.time_elapsed += minutes_elapsed
 
-        steps_per_minute = (
-            self.steps_since_last_log / minutes_elapsed if minutes_elapsed > 0 else 0
-        )
+        steps, self.steps_since_last_log = self.steps_since_last_log, 0
+        self._steps_logged += steps
+        steps_per_minute = steps / minutes_elapsed if minutes_elapsed > 0 else 0
 
-        wandb.define_metric("step_stats/*", step_metric="total_time_elapsed")
+        if not self._metric_defined:
+            wandb.define_metric("step_stats/*", step_metric="total_time_elapsed")
+            self._metric_defined = True
         self._wandb_logger.log(
             {
-                "step_stats/total_eval_steps": self.total_steps,
+                "step_stats/total_eval_steps": self._steps_logged,
                 "step_stats/eval_steps_per_minute": steps_per_minute,
                 "total_time_elapsed": self.time_elapsed,
             }
         )
 
         self.last_log_time = current_time
-        self.steps_since_last_log = 0
@@ -1,9 +1,17 @@
+import hashlib
 import json
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+try:
+    # optional Rust JSON codec; several times faster than the stdlib json module
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class RobotType(Enum):
     FRANKA = "franka"
@@ -20,8 +28,22 @@ class ControlMode(str, Enum):
 
 
 class TimeStamp:
+    # stored as integer ns since the epoch; the (local, naive) datetime is only
+    # built when the timestamp is formatted
+    __slots__ = ("ns",)
+
     def __init__(self):
-        self.timestamp = datetime.now()
+        self.ns = time.time_ns()
+
+    @property
+    def timestamp(self) -> datetime:
+        seconds, ns = divmod(self.ns, 10**9)
+        return datetime.fromtimestamp(seconds).replace(microsecond=ns // 1000)
+
+    @timestamp.setter
+    def timestamp(self, value: datetime):
+        seconds = int(value.replace(microsecond=0).timestamp())
+        self.ns = seconds * 10**9 + value.microsecond * 1000
 
     def __str__(self):
         # Returns the timestamp in ISO 8601 format
@@ -34,14 +56,25 @@ class TimeStamp:
 
 @dataclass
 class EvalID:
-    id: str
+    __slots__ = ("id",)
+
+    id: int
 
     @classmethod
     def create(cls, time: TimeStamp, robot_type: RobotType, custom_name: str = None):
-        """Generates a hash for EvalID based on TimeStamp, robot_type,
-        and optional custom_name."""
-        hash_input = f"{time}{robot_type}{custom_name or ''}"
-        return cls(id=abs(hash(hash_input)))
+        """Generates a stable 64-bit blake2b hash for EvalID based on TimeStamp,
+        robot_type, and optional custom_name (same inputs -> same id in any process).
+        """
+        # NUL-separated so that e.g. ("a", "bc") and ("ab", "c") hash differently
+        buf = b"\x00".join(
+            (
+                str(time).encode(),
+                RobotType(robot_type).value.encode(),
+                (custom_name or "").encode(),
+            )
+        )
+        digest = hashlib.blake2b(buf, digest_size=8).digest()
+        return cls(id=int.from_bytes(digest, "big"))
 
 
 @dataclass
@@ -56,35 +89,46 @@ class MetaData:
     evaluator_name: Optional[str] = None
     eval_name: Optional[str] = None
 
-    def save(self, file_path: str):
-        """Saves the MetaData instance to a JSON file."""
+    def save(self, file_path: str, exclusive: bool = False):
+        """Saves the MetaData instance to a JSON file.
+
+        With ``exclusive=True`` the file is created atomically and
+        ``FileExistsError`` is raised if it already exists.
+        """
         # Convert eval_id to a serializable format
         data_to_save = {
             "eval_id": self.eval_id.id,  # Save only the id
             "location": self.location,
             "robot_name": self.robot_name,
             "robot_type": self.robot_type.value,  # Save robot_type as string
-            "time": self.time.timestamp.isoformat(),  # Save timestamp as string
+            "time": str(self.time),  # Save timestamp as ISO 8601 string
+            "time_ns": self.time.ns,  # and exactly, as ns since the epoch
             "evaluator_name": self.evaluator_name,
             "eval_name": self.eval_name,
             "control_mode": self.control_mode.value,
             "action_frequency_hz": self.action_frequency_hz,
         }
-        with open(file_path, "w") as json_file:
-            json.dump(data_to_save, json_file)
+        if orjson is not None:
+            encoded = orjson.dumps(data_to_save, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            encoded = json.dumps(data_to_save).encode()
+        with open(file_path, "xb" if exclusive else "wb") as json_file:
+            json_file.write(encoded)
 
     @classmethod
     def load(cls, file_path: str):
         """Loads MetaData from a JSON file."""
-        with open(file_path, "r") as json_file:
-            data = json.load(json_file)
+        with open(file_path, "rb") as json_file:
+            raw = json_file.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             # Reconstruct the EvalID and TimeStamp objects
             eval_id = EvalID(id=data["eval_id"])
             robot_type = RobotType(data["robot_type"])  # Convert back to RobotType
             time = TimeStamp()
-            time.timestamp = datetime.fromisoformat(
-                data["time"]
-            )  # Convert back to datetime
+            if "time_ns" in data:
+                time.ns = data["time_ns"]
+            else:  # written before time_ns was saved
+                time.timestamp = datetime.fromisoformat(data["time"])
             if "control_mode" not in data:
                 raise ValueError(
                     "metadata.json is missing required field 'control_mode'"
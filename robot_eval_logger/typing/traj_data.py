@@ -1,11 +1,19 @@
+import functools
 import io
 import pickle
 from dataclasses import dataclass, fields
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 
+try:
+    # optional libjpeg-turbo binding; ~1.5-2x faster than Pillow for RGB frames
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
 _LZ4_MAGIC = b"\x04\x22\x4d\x18"
+_JPEG_MAGIC = b"\xff\xd8"
 
 _NUMERIC_STEP_FIELDS = (
     "action",
@@ -50,9 +58,13 @@ class TrajData:
         policy_id (optional), partial_success, language_feedback,
         duration_seconds (wall time for the episode, set by :class:`EvalLogger`), …
 
-    Step-level (lists, one entry per logged timestep):
-        obs (camera -> list of images), action, joint_position, joint_velocity,
-        end_effector_pose, gripper, joint_effort
+    Step-level (one row per logged timestep):
+        obs (camera -> ``(T, H, W, C)`` images), action, joint_position,
+        joint_velocity, end_effector_pose, gripper, joint_effort (``(T, D)``)
+
+    Trajectories built by :class:`EvalLogger` hold contiguous stacked arrays;
+    hand-built or legacy trajectories may hold per-step lists instead (see
+    ``stack_arrays`` in :meth:`save`).
 
     Extra keys are accepted via ``__init__(**kwargs)`` (e.g. legacy pickles).
     """
@@ -66,13 +78,13 @@ class TrajData:
     policy_id: Optional[str] = None
     collection_time: Optional[str] = None
 
-    obs: Optional[Dict[str, List[np.ndarray]]] = None
-    action: Optional[List[np.ndarray]] = None
-    joint_position: Optional[List[np.ndarray]] = None
-    joint_velocity: Optional[List[np.ndarray]] = None
-    end_effector_pose: Optional[List[np.ndarray]] = None
-    gripper: Optional[List[np.ndarray]] = None
-    joint_effort: Optional[List[np.ndarray]] = None
+    obs: Optional[Dict[str, np.ndarray]] = None
+    action: Optional[np.ndarray] = None
+    joint_position: Optional[np.ndarray] = None
+    joint_velocity: Optional[np.ndarray] = None
+    end_effector_pose: Optional[np.ndarray] = None
+    gripper: Optional[np.ndarray] = None
+    joint_effort: Optional[np.ndarray] = None
 
     def __init__(self, **kwargs):
         for key, value in kwargs.items():
@@ -84,15 +96,21 @@ class TrajData:
         *,
         compress_images: bool = False,
         image_quality: int = 90,
+        image_format: str = "jpeg",
         stack_arrays: bool = False,
         compress_pickle: bool = False,
-        use_highest_pickle_protocol: bool = False,
+        use_highest_pickle_protocol: bool = True,
     ) -> None:
-        """Serialize this trajectory to *file_path* with optional optimizations"""
+        """Serialize this trajectory to *file_path* with optional optimizations
+
+        The highest pickle protocol (5+, PEP 574) is used by default: numpy
+        arrays are then written straight from their own buffers instead of
+        being copied into an intermediate ``bytes`` object first.
+        """
         save_obj = self
         if compress_images or stack_arrays:
             save_obj = self._prepare_for_save(
-                compress_images, image_quality, stack_arrays
+                compress_images, image_quality, stack_arrays, image_format
             )
 
         protocol = (
@@ -104,30 +122,32 @@ class TrajData:
         if compress_pickle:
             import lz4.frame
 
-            data = pickle.dumps(save_obj, protocol=protocol)
-            with open(file_path, "wb") as f:
-                f.write(lz4.frame.compress(data))
+            # stream the pickle through the lz4 frame writer so neither the raw
+            # nor the compressed payload is materialized in memory
+            with lz4.frame.open(file_path, "wb") as f:
+                pickle.dump(save_obj, f, protocol=protocol)
         else:
             with open(file_path, "wb") as f:
                 pickle.dump(save_obj, f, protocol=protocol)
 
     def _prepare_for_save(
-        self, compress_images: bool, image_quality: int, stack_arrays: bool
+        self,
+        compress_images: bool,
+        image_quality: int,
+        stack_arrays: bool,
+        image_format: str = "jpeg",
     ) -> "TrajData":
-        """Return a lightweight copy with images JPEG-encoded and/or arrays stacked."""
+        """Return a lightweight copy with images encoded and/or arrays stacked."""
         data = self.to_dict()
 
         if compress_images and "obs" in data and data["obs"] is not None:
-            data["obs"] = _encode_obs_images(data["obs"], image_quality)
+            data["obs"] = _encode_obs_images(data["obs"], image_quality, image_format)
 
         if stack_arrays:
             for name in _NUMERIC_STEP_FIELDS:
                 val = data.get(name)
                 if isinstance(val, list) and len(val) > 0:
-                    try:
-                        data[name] = np.stack(val)
-                    except (ValueError, TypeError):
-                        pass
+                    data[name] = _stack_if_possible(val)
 
         return TrajData(**data)
 
@@ -143,58 +163,132 @@ class TrajData:
             if header == _LZ4_MAGIC:
                 import lz4.frame
 
-                return pickle.loads(lz4.frame.decompress(f.read()))
+                # unpickle from the decompressing stream; the array buffers are
+                # read straight into their final objects, with no intermediate
+                # compressed / decompressed copy of the whole file
+                with lz4.frame.open(f, "rb") as lz4_f:
+                    return pickle.load(lz4_f)
             return pickle.load(f)
 
     @staticmethod
     def decode_images(
-        obs: Dict[str, list],
-    ) -> Dict[str, List[np.ndarray]]:
-        """Decode JPEG-encoded obs images back to numpy arrays.
-
-        Accepts a mixed dict — entries that are already ``np.ndarray`` are
-        passed through unchanged, so this is safe to call unconditionally.
+        obs: Dict[str, Union[np.ndarray, list]],
+    ) -> Dict[str, Union[np.ndarray, List[np.ndarray]]]:
+        """Decode JPEG/PNG-encoded obs images back to numpy arrays.
+
+        Each camera is returned as one stacked ``(T, H, W[, C])`` array, the same
+        layout an uncompressed save loads with; frames that cannot be stacked
+        (e.g. changing shapes) stay a list. Already-stacked arrays and per-frame
+        ``np.ndarray`` entries are passed through, so this is safe to call
+        unconditionally.
         """
-        from PIL import Image
-
-        decoded: Dict[str, List[np.ndarray]] = {}
+        decoded: Dict[str, Union[np.ndarray, List[np.ndarray]]] = {}
         for cam, img_list in obs.items():
-            decoded[cam] = [
-                np.asarray(Image.open(io.BytesIO(img)))
-                if isinstance(img, bytes)
-                else img
-                for img in img_list
-            ]
+            if isinstance(img_list, np.ndarray):
+                decoded[cam] = img_list
+                continue
+            decoded[cam] = _stack_if_possible(
+                [
+                    _decode_image(img) if isinstance(img, bytes) else img
+                    for img in img_list
+                ]
+            )
         return decoded
 
 
-def _encode_obs_images(obs: Dict[str, list], quality: int = 85) -> Dict[str, list]:
-    """JPEG-encode each image array in *obs*, returning ``bytes`` blobs."""
+def _encode_jpeg(img: np.ndarray, quality: int) -> bytes:
+    """JPEG-encode one image, using simplejpeg for RGB uint8 frames if available."""
+    if (
+        simplejpeg is not None
+        and img.dtype == np.uint8
+        and img.ndim == 3
+        and img.shape[2] == 3
+    ):
+        return simplejpeg.encode_jpeg(
+            np.ascontiguousarray(img),
+            quality=quality,
+            colorspace="RGB",
+            colorsubsampling="420",
+        )
+
+    from PIL import Image
+
+    buf = io.BytesIO()
+    Image.fromarray(img).save(buf, format="JPEG", quality=quality)
+    return buf.getvalue()
+
+
+def _decode_image(blob: bytes) -> np.ndarray:
+    """Decode one encoded image, using simplejpeg for color JPEGs if available."""
+    if (
+        simplejpeg is not None
+        and blob[:2] == _JPEG_MAGIC
+        and simplejpeg.decode_jpeg_header(blob)[2] == "YCbCr"
+    ):
+        return simplejpeg.decode_jpeg(blob, colorspace="RGB")
+
+    from PIL import Image
+
+    return np.asarray(Image.open(io.BytesIO(blob)))
+
+
+def _encode_png(img: np.ndarray) -> bytes:
+    """Losslessly PNG-encode one image with Pillow."""
     from PIL import Image
 
+    buf = io.BytesIO()
+    # level 3 is within a few percent of the max ratio at a fraction of the cost
+    Image.fromarray(img).save(buf, format="PNG", compress_level=3)
+    return buf.getvalue()
+
+
+def _encode_obs_images(
+    obs: Dict[str, list], quality: int = 85, image_format: str = "jpeg"
+) -> Dict[str, list]:
+    """Encode each image array in *obs* as JPEG or PNG, returning ``bytes`` blobs."""
+    if image_format == "jpeg":
+        encode = functools.partial(_encode_jpeg, quality=quality)
+    elif image_format == "png":
+        encode = _encode_png
+    else:
+        raise ValueError(f"image_format must be 'jpeg' or 'png', got {image_format!r}")
+
     encoded: Dict[str, list] = {}
     for cam_name, img_list in obs.items():
-        out = []
-        for img in img_list:
-            if isinstance(img, np.ndarray):
-                buf = io.BytesIO()
-                Image.fromarray(img).save(buf, format="JPEG", quality=quality)
-                out.append(buf.getvalue())
-            else:
-                out.append(img)
-        encoded[cam_name] = out
+        encoded[cam_name] = [
+            encode(img) if isinstance(img, np.ndarray) else img for img in img_list
+        ]
     return encoded
 
 
 def _transpose_dicts_per_timestep(dicts: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
     """``[{"a": x1, "b": y1}, {"a": x2, "b": y2}]`` → ``{"a": [x1, x2], "b": [y1, y2]}``."""
-    all_keys = {k for d in dicts for k in d}
-    return {k: [d.get(k) for d in dicts] for k in all_keys}
+    # single pass over the steps; keys missing at a timestep stay None
+    out: Dict[str, List[Any]] = {}
+    for t, d in enumerate(dicts):
+        for k, v in d.items():
+            if k not in out:
+                out[k] = [None] * len(dicts)
+            out[k][t] = v
+    return out
+
+
+def _stack_if_possible(values: list):
+    """``np.stack`` *values* into one contiguous array; return them unchanged if
+    they cannot be stacked (mismatched shapes, ``None`` entries, …)."""
+    try:
+        return np.stack(values)
+    except (ValueError, TypeError):
+        return values
 
 
 def step_data_sequence_to_traj_data(steps: List[StepData]) -> TrajData:
     """Aggregate :class:`StepData` rows into a :class:`TrajData` with step-level fields only.
 
+    Each step-level field is stacked into one contiguous array: ``(T, D)`` for
+    numeric fields and ``(T, H, W, C)`` per camera in ``obs``. A field whose
+    per-step values cannot be stacked (e.g. changing shapes) is kept as a list.
+
     Episode-level fields (``language_command``, ``success``, …) must be set by the caller
     before saving.
     """
@@ -206,9 +300,12 @@ def step_data_sequence_to_traj_data(steps: List[StepData]) -> TrajData:
         if not any(v is not None for v in values):
             continue
         if isinstance(values[0], dict):
-            step_kw[field.name] = _transpose_dicts_per_timestep(values)
+            step_kw[field.name] = {
+                k: _stack_if_possible(v)
+                for k, v in _transpose_dicts_per_timestep(values).items()
+            }
         else:
-            step_kw[field.name] = values
+            step_kw[field.name] = _stack_if_possible(values)
     return TrajData(**step_kw)
 
 
@@ -1,7 +1,8 @@
 import time
 from collections import defaultdict
+from typing import Optional
 
-from robot_eval_logger.typing import *
+from robot_eval_logger.typing import EvalID, RobotType, TimeStamp
 
 
 def make_eval_id_and_timestamp(
@@ -18,6 +19,8 @@ def make_eval_id_and_timestamp(
 
 
 class _TimerContextManager:
+    __slots__ = ("timer", "key")
+
     def __init__(self, timer: "Timer", key: str):
         self.timer = timer
         self.key = key
@@ -30,25 +33,28 @@ class _TimerContextManager:
 
 
 class Timer:
+    __slots__ = ("counts", "times", "start_times")
+
     def __init__(self):
         self.reset()
 
     def reset(self):
         self.counts = defaultdict(int)
-        self.times = defaultdict(float)
+        self.times = defaultdict(int)  # integer nanoseconds; seconds on read
         self.start_times = {}
 
     def tick(self, key):
         if key in self.start_times:
             raise ValueError(f"Timer is already ticking for key: {key}")
-        self.start_times[key] = time.time()
+        self.start_times[key] = time.perf_counter_ns()
 
     def tock(self, key):
-        if key not in self.start_times:
+        end = time.perf_counter_ns()
+        start_times = self.start_times
+        if key not in start_times:
             raise ValueError(f"Timer is not ticking for key: {key}")
         self.counts[key] += 1
-        self.times[key] += time.time() - self.start_times[key]
-        del self.start_times[key]
+        self.times[key] += end - start_times.pop(key)
 
     def context(self, key):
         """
@@ -62,13 +68,13 @@ class Timer:
         return _TimerContextManager(self, key)
 
     def get_average_times(self, reset=True):
-        ret = {key: self.times[key] / self.counts[key] for key in self.counts}
+        ret = {key: self.times[key] * 1e-9 / self.counts[key] for key in self.counts}
         if reset:
             self.reset()
         return ret
 
     def get_times(self, key, reset=True):
-        ret = self.times[key]
+        ret = self.times[key] * 1e-9
         if reset:
             self.reset()
         return ret
@@ -1,12 +1,10 @@
-from collections import deque
+import threading
 from typing import Tuple
 
-import cv2
-import moviepy.editor as mpy
 import numpy as np
-import wandb
-from matplotlib import pyplot as plt
-from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+
+# cv2, imageio_ffmpeg, matplotlib and wandb are imported inside the methods that
+# use them, so importing the package (e.g. only to load TrajData) stays cheap
 
 
 class FrameVisualizer:
@@ -21,6 +19,9 @@ class FrameVisualizer:
         episode_viz_frame_interval: int = 10,
         periodic_log_initial_and_final_frames: bool = True,
         success_viz_every_n: int = 10,
+        media_log_every_n: int = 1,
+        success_plot_backend: str = "cv2",
+        image_file_type: str = "jpg",
     ):
         """
         Args:
@@ -32,16 +33,53 @@ class FrameVisualizer:
                 initial and final frames of the trajectory along with success predictions
             success_viz_every_n (int): log every n frames for periodic success predictions
                 if set to True.
+            media_log_every_n (int): only log the frame strip and video every n
+                episodes. Each wandb.Image / wandb.Video is encoded and written
+                to disk when logged, so raising this cuts per-episode overhead
+                on long evals.
+            success_plot_backend (str): how the periodic initial/final frames
+                plot is drawn: "cv2" composes it directly with numpy/OpenCV
+                (fast), "matplotlib" renders the original figure (slower).
+            image_file_type (str): encoding wandb uses for the logged images.
+                "jpg" is ~25x faster to encode than "png" for these frame strips;
+                use "png" for lossless images.
         """
+        if success_plot_backend not in ("cv2", "matplotlib"):
+            raise ValueError(
+                f"success_plot_backend must be 'cv2' or 'matplotlib', "
+                f"got {success_plot_backend!r}"
+            )
+        if image_file_type not in ("png", "jpg", "jpeg", "bmp"):
+            raise ValueError(
+                f"image_file_type must be 'png', 'jpg', 'jpeg' or 'bmp', "
+                f"got {image_file_type!r}"
+            )
+        if media_log_every_n < 1:
+            raise ValueError(
+                f"media_log_every_n must be >= 1, got {media_log_every_n!r}"
+            )
         self.video_fps = video_fps
         self.video_frame_size = video_frame_size
         self.episode_viz_frame_interval = episode_viz_frame_interval
         self.success_viz_every_n = success_viz_every_n
+        self.media_log_every_n = media_log_every_n
+        self.success_plot_backend = success_plot_backend
+        self.image_file_type = image_file_type
         self.periodic_log_initial_and_final_frames = (
             periodic_log_initial_and_final_frames
         )
 
-        self.past_frames = {}  # prefix --> list of frames
+        self.past_frames = {}  # prefix --> _FrameRingBuffer of initial/final frames
+
+        # matplotlib success-plot backend: one figure, created on first use and
+        # redrawn for every plot; the lock guards it against concurrent renders
+        self._success_plot_figure = None
+        self._success_plot_lock = threading.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of episodes buffered for the next initial/final frames plot."""
+        return sum(len(buffer) for buffer in self.past_frames.values())
 
     def log_frames(
         self,
@@ -56,34 +94,48 @@ class FrameVisualizer:
         if frames is None:
             return {}
 
-        # save frames
-        data = {
-            "frames": (frames[0], frames[-1]) if len(frames) > 0 else None,
-        }
+        import cv2
+        import wandb
+
+        log_media = len(frames) > 0 and step % self.media_log_every_n == 0
+
+        # Resize every frame once; the strip, the video and the saved
+        # initial/final frames share the result. Frames already at the target
+        # size are used as-is.
+        size = tuple(self.video_frame_size)  # (width, height), as in cv2
+
+        def resize(frame):
+            return frame if frame.shape[1::-1] == size else cv2.resize(frame, size)
+
+        if log_media:
+            low_quality_frames = [resize(frame) for frame in frames]
+        elif len(frames) > 0:
+            low_quality_frames = [resize(frames[0]), resize(frames[-1])]
+
+        # the ring buffer copies the small initial/final frames; a reference into
+        # the caller's frames could keep the whole full-resolution episode alive
         if logging_prefix not in self.past_frames:
-            self.past_frames[logging_prefix] = deque(maxlen=self.success_viz_every_n)
-        self.past_frames[logging_prefix].append(data)
+            self.past_frames[logging_prefix] = _FrameRingBuffer(
+                self.success_viz_every_n
+            )
+        if len(frames) > 0:
+            self.past_frames[logging_prefix].append(
+                low_quality_frames[0], low_quality_frames[-1]
+            )
 
         # frames to log
         to_log = {}
-        if len(frames) > 0:
+        if log_media:
             # log every n frames
-            every_n_frames = frames[:: self.episode_viz_frame_interval] + [frames[-1]]
-            # Resize frames to ensure consistent display and avoid artifacts
-            resized_frames = [
-                cv2.resize(frame, self.video_frame_size) for frame in every_n_frames
-            ]
-            combined_frame = cv2.hconcat(resized_frames)
-            to_log[f"{logging_prefix}/frames"] = wandb.Image(combined_frame)
+            every_n_frames = low_quality_frames[:: self.episode_viz_frame_interval]
+            combined_frame = cv2.hconcat(every_n_frames + [low_quality_frames[-1]])
+            to_log[f"{logging_prefix}/frames"] = wandb.Image(
+                combined_frame, file_type=self.image_file_type
+            )
 
             # log low quality video
-            frame_size = self.video_frame_size
             tmp_filename = f"/tmp/{logging_prefix}_video.mp4"
-            low_quality_frames = [cv2.resize(frame, frame_size) for frame in frames]
-            # create the video clip
-            clip = mpy.ImageSequenceClip(low_quality_frames, fps=self.video_fps)
-            # write the video with libx264 encoding
-            clip.write_videofile(tmp_filename, codec="libx264", preset="ultrafast")
+            self._write_video(low_quality_frames, tmp_filename)
             to_log[f"{logging_prefix}/video"] = wandb.Video(tmp_filename)
 
         # periodic logging of initial/final frames, along with success predictions
@@ -91,56 +143,152 @@ class FrameVisualizer:
             (step + 1) % self.success_viz_every_n == 0
             and self.periodic_log_initial_and_final_frames
         ):
-            assert len(self.past_frames[logging_prefix]) == self.success_viz_every_n
-
-            frames = [data["frames"] for data in self.past_frames[logging_prefix]]
-            frames = [frame for frame in frames if frame is not None]  # list of tuples
+            initial_frames, final_frames = self.past_frames[logging_prefix].get()
             img = self._plot_frames_with_success(
-                frames=frames,
+                initial_frames=initial_frames,
+                final_frames=final_frames,
                 past_success_rates=success_rates,
                 step=step,
             )
 
             # log
-            to_log[f"{logging_prefix}/initial_and_final_frames"] = wandb.Image(img)
+            to_log[f"{logging_prefix}/initial_and_final_frames"] = wandb.Image(
+                img, file_type=self.image_file_type
+            )
 
             # pop off data already logged
             self.past_frames[logging_prefix].clear()
 
         return to_log
 
-    def _plot_frames_with_success(self, frames, past_success_rates, step):
+    def _write_video(self, frames, filename):
+        """
+        encode frames to an mp4 with libx264, piping raw frames straight to ffmpeg
+        """
+        import imageio_ffmpeg
+
+        height, width = frames[0].shape[:2]
+        writer = imageio_ffmpeg.write_frames(
+            filename,
+            size=(width, height),
+            pix_fmt_in="gray" if frames[0].ndim == 2 else "rgb24",
+            fps=self.video_fps,
+            codec="libx264",
+            quality=None,  # libx264 default crf
+            macro_block_size=2,  # yuv420p needs even dimensions
+            output_params=["-preset", "ultrafast"],
+        )
+        writer.send(None)  # start the ffmpeg subprocess
+        for frame in frames:
+            writer.send(np.ascontiguousarray(frame))
+        writer.close()
+
+    def _plot_frames_with_success(
+        self, initial_frames, final_frames, past_success_rates, step
+    ):
         """
         make a combined plot where the first two rows are the initial/final frames
         and the third row is the success predictions
+
+        initial_frames / final_frames are (n, H, W[, C]) arrays, one row per episode
+        """
+        if self.success_plot_backend == "matplotlib":
+            return self._plot_frames_with_success_matplotlib(
+                initial_frames, final_frames, past_success_rates, step
+            )
+
+        import cv2
+
+        n = len(initial_frames)
+        combined_frame = _frame_mosaic(initial_frames, final_frames)
+        if combined_frame.ndim == 2:
+            combined_frame = cv2.cvtColor(combined_frame, cv2.COLOR_GRAY2RGB)
+        width = combined_frame.shape[1]
+        tile_width = width // n
+        success_predictions = list(past_success_rates[-n:])
+
+        # success predictions, one point under each column of frames
+        plot_height, top, bottom = 120, 24, 22
+        canvas = np.full((plot_height, width, 3), 255, dtype=np.uint8)
+        font, black = cv2.FONT_HERSHEY_SIMPLEX, (0, 0, 0)
+        gray, blue = (160, 160, 160), (31, 119, 180)
+        y_lo = min([0.0] + success_predictions)
+        y_hi = max([1.0] + success_predictions)
+
+        def y_pixel(value):
+            frac = (value - y_lo) / (y_hi - y_lo)
+            return round(plot_height - bottom - frac * (plot_height - top - bottom))
+
+        def put_text(text, x, y, scale, color, anchor="left"):
+            text_width = cv2.getTextSize(text, font, scale, 1)[0][0]
+            x -= {"left": 0, "center": text_width // 2, "right": text_width}[anchor]
+            cv2.putText(canvas, text, (x, y), font, scale, color, 1, cv2.LINE_AA)
+
+        put_text("Success predictions", 4, 16, 0.45, black)
+        for value in (y_lo, y_hi):
+            y = y_pixel(value)
+            cv2.line(canvas, (0, y), (width, y), gray, 1)
+            put_text(f"{value:g}", width - 2, y - 3, 0.35, gray, anchor="right")
+
+        offset = n - len(success_predictions)
+        points = np.array(
+            [
+                [(offset + i) * tile_width + tile_width // 2, y_pixel(value)]
+                for i, value in enumerate(success_predictions)
+            ],
+            dtype=np.int32,
+        ).reshape(-1, 2)
+        cv2.polylines(canvas, [points], False, blue, 2, cv2.LINE_AA)
+        for (x, y), i in zip(points.tolist(), range(step + 1 - n + offset, step + 1)):
+            cv2.circle(canvas, (x, y), 4, blue, -1, cv2.LINE_AA)
+            put_text(str(i), x, plot_height - 6, 0.35, black, anchor="center")
+
+        return cv2.vconcat([combined_frame, canvas])
+
+    def _plot_frames_with_success_matplotlib(
+        self, initial_frames, final_frames, past_success_rates, step
+    ):
         """
-        n = len(frames)
+        matplotlib version of :meth:`_plot_frames_with_success`
+        """
+        n = len(initial_frames)
         i_episode = range(step + 1 - n, step + 1)
-        combined_frame = cv2.hconcat([cv2.vconcat(f) for f in frames])
+        combined_frame = _frame_mosaic(initial_frames, final_frames)
         success_predictions = past_success_rates[-n:]
 
-        fig, axs = plt.subplots(2, 1, figsize=(8, 4))
-        canvas = FigureCanvas(fig)
+        with self._success_plot_lock:
+            if self._success_plot_figure is None:
+                # a bare Figure (not pyplot) is not registered with the pyplot
+                # figure manager, so it is never leaked or shared across threads
+                from matplotlib.backends.backend_agg import FigureCanvasAgg
+                from matplotlib.figure import Figure
+
+                fig = Figure(figsize=(8, 4), layout="tight")
+                FigureCanvasAgg(fig)
+                self._success_plot_figure = fig, fig.subplots(2, 1)
+            fig, axs = self._success_plot_figure
+            for ax in axs:
+                ax.clear()
 
-        # frames
-        axs[0].imshow(combined_frame)
-        axs[0].set_axis_off()
-        axs[0].set_title("Initial and final frames")
+            # frames
+            axs[0].imshow(combined_frame)
+            axs[0].set_axis_off()
+            axs[0].set_title("Initial and final frames")
 
-        # success predictions
-        axs[1].plot(i_episode, success_predictions, marker="o")
-        plt.xticks(i_episode)
-        axs[0].set_title("Success predictions")
+            # success predictions
+            axs[1].plot(i_episode, success_predictions, marker="o")
+            axs[1].set_xticks(i_episode)
+            axs[1].set_title("Success predictions")
 
-        plt.tight_layout()
-        canvas.draw()
-        out_image = np.array(canvas.renderer.buffer_rgba())
+            fig.canvas.draw()
+            # drop alpha: RGB like the cv2 backend, and JPEG has no alpha channel
+            out_image = np.asarray(fig.canvas.buffer_rgba())[..., :3].copy()
         return out_image
 
     def log_remaining_frames(self, final_step, success_rates=None):
         """
         Log any remaining frames in self.past_frames that haven't been logged due to
-        not reaching the periodic logging threshold.
+        not reaching the periodic logging threshold, and clear them.
 
         Args:
             final_step (int): The final step number to use for logging
@@ -149,19 +297,17 @@ class FrameVisualizer:
         Returns:
             dict: Dictionary of logged items to be passed to wandb
         """
+        import wandb
+
         to_log = {}
 
-        for logging_prefix, frames_data in self.past_frames.items():
+        for logging_prefix, frames_buffer in self.past_frames.items():
             # Skip if no frames or already logged in the last periodic log
-            if not frames_data or len(frames_data) == 0:
+            if len(frames_buffer) == 0:
                 continue
 
-            # Extract frames and filter out None values
-            frames = [data["frames"] for data in frames_data]
-            frames = [frame for frame in frames if frame is not None]  # list of tuples
-
-            if not frames:
-                continue
+            initial_frames, final_frames = frames_buffer.get()
+            frames_buffer.clear()  # so a second call does not log them again
 
             # Get corresponding success rates if available
             prefix_success_rates = None
@@ -170,14 +316,65 @@ class FrameVisualizer:
 
             # Create visualization
             img = self._plot_frames_with_success(
-                frames=frames,
+                initial_frames=initial_frames,
+                final_frames=final_frames,
                 past_success_rates=prefix_success_rates
                 if prefix_success_rates
-                else [0] * len(frames),
+                else [0] * len(initial_frames),
                 step=final_step,
             )
 
             # Log the image
-            to_log[f"{logging_prefix}/initial_and_final_frames"] = wandb.Image(img)
+            to_log[f"{logging_prefix}/initial_and_final_frames"] = wandb.Image(
+                img, file_type=self.image_file_type
+            )
 
         return to_log
+
+
+class _FrameRingBuffer:
+    """
+    fixed-capacity buffer of (initial, final) frame pairs, kept in two preallocated
+    (capacity, H, W[, C]) arrays; the oldest pair is overwritten once full
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._initial = None
+        self._final = None
+        self._count = 0  # pairs appended since the last clear()
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def append(self, initial_frame, final_frame):
+        if self._initial is None or self._initial.shape[1:] != initial_frame.shape:
+            shape = (self.capacity,) + initial_frame.shape
+            self._initial = np.empty(shape, dtype=initial_frame.dtype)
+            self._final = np.empty(shape, dtype=initial_frame.dtype)
+            self._count = 0
+        i = self._count % self.capacity
+        self._initial[i] = initial_frame
+        self._final[i] = final_frame
+        self._count += 1
+
+    def get(self):
+        """(initial_frames, final_frames), oldest episode first"""
+        n = len(self)
+        if self._count <= self.capacity:
+            return self._initial[:n], self._final[:n]
+        i = self._count % self.capacity
+        return np.roll(self._initial, -i, axis=0), np.roll(self._final, -i, axis=0)
+
+    def clear(self):
+        self._count = 0
+
+
+def _frame_mosaic(initial_frames, final_frames):
+    """
+    one column per episode, initial frame above final frame: (2H, n * W[, C])
+    """
+    # (n, 2H, W[, C]) -> concatenating the episodes along the width axis
+    return np.concatenate(
+        np.concatenate([initial_frames, final_frames], axis=1), axis=1
+    )
@@ -1,6 +1,5 @@
 import datetime
-import random
-import string
+import secrets
 import tempfile
 from copy import copy
 from socket import gethostname
@@ -10,25 +9,27 @@ import ml_collections
 import wandb
 
 
-def _recursive_flatten_dict(d: dict):
-    keys, values = [], []
+def _recursive_flatten_dict(d: dict, prefix: str = "", out: dict = None) -> dict:
+    """``{"a": {"b": 1}, "c": 2}`` -> ``{"a/b": 1, "c": 2}``.
+
+    Leaves are written straight into a single output dict, so each key is built
+    once regardless of nesting depth.
+    """
+    if out is None:
+        out = {}
     for key, value in d.items():
+        full_key = f"{prefix}/{key}" if prefix else key
         if isinstance(value, dict):
-            sub_keys, sub_values = _recursive_flatten_dict(value)
-            keys += [f"{key}/{k}" for k in sub_keys]
-            values += sub_values
+            _recursive_flatten_dict(value, full_key, out)
         else:
-            keys.append(key)
-            values.append(value)
-    return keys, values
+            out[full_key] = value
+    return out
 
 
 def generate_random_string(length=6):
-    # Define the character set for the random string
-    characters = string.digits  # Use digits 0-9
-
-    # Generate the random string by sampling from the character set
-    random_string = "".join(random.choices(characters, k=length))
+    # one OS-entropy draw formatted as zero-padded digits 0-9; independent of the
+    # global `random` state, so seeding the eval does not repeat run identifiers
+    random_string = f"{secrets.randbelow(10**length):0{length}d}"
 
     return "rnd" + random_string
 
@@ -101,6 +102,4 @@ class WandBLogger(object):
         wandb.config.update(flag_dict)
 
     def log(self, data: dict, step: int = None):
-        data_flat = _recursive_flatten_dict(data)
-        data = {k: v for k, v in zip(*data_flat)}
-        wandb.log(data, step=step)
+        wandb.log(_recursive_flatten_dict(data), step=step)
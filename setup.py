@@ -6,10 +6,10 @@ setup(
     version="0.0.1",
     install_requires=[
         "absl-py",
-        "wandb",
-        "moviepy==1.0.3",
+        "wandb>=0.16.1",  # wandb.Image(file_type=...)
+        "imageio-ffmpeg",
         "huggingface-hub",
-        "numpy<2.0.0",
+        "numpy",
         "lz4",
         "Pillow",
     ],
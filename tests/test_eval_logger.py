@@ -0,0 +1,231 @@
+"""Tests for :class:`robot_eval_logger.eval_logger.EvalLogger` episode bookkeeping.
+
+How to run (from the repository root)::
+
+    python -m pytest tests/test_eval_logger.py -v -o addopts=
+"""
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from robot_eval_logger.eval_logger import EvalLogger
+
+
+def _log_dummy_steps(logger: EvalLogger, n_steps: int = 3):
+    z = np.zeros(7, dtype=np.float32)
+    for _ in range(n_steps):
+        logger.log_step(
+            obs={"image_primary": np.zeros((4, 4, 3), dtype=np.uint8)},
+            action=z,
+            joint_position=z,
+            joint_velocity=z,
+            end_effector_pose=z,
+            gripper=z[:1],
+        )
+
+
+class TestLogSuccessRates:
+    def test_matches_full_history_recompute(self, rng):
+        logger = EvalLogger()
+        history = []
+        for success in rng.random(57) < 0.4:
+            stats = logger.log_success_rates("task", success)
+            history.append(float(success))
+            assert stats["task/episode_success"] == float(success)
+            assert stats["task/cumulative_num_success"] == sum(history)
+            assert stats["task/recent_success_rate"] == pytest.approx(
+                round(np.mean(history[-20:]), 4)
+            )
+            assert stats["task/overall_success_rate"] == pytest.approx(
+                round(np.mean(history), 4)
+            )
+        assert logger.past_success_rates["task"] == history
+
+    def test_stats_are_plain_python_floats(self):
+        logger = EvalLogger()
+        stats = logger.log_success_rates("task", np.bool_(True))
+        assert all(type(v) is float for v in stats.values())
+
+    def test_prefixes_tracked_independently(self):
+        logger = EvalLogger()
+        logger.log_success_rates("a", True)
+        logger.log_success_rates("b", False)
+        stats = logger.log_success_rates("a", False)
+        assert stats["a/cumulative_num_success"] == 1.0
+        assert stats["a/overall_success_rate"] == 0.5
+        assert logger.past_success_rates["b"] == [0.0]
+
+
+class TestDefineMetric:
+    @patch("robot_eval_logger.eval_logger.wandb.define_metric")
+    def test_metrics_defined_once_per_prefix(self, mock_define):
+        logger = EvalLogger(wandb_logger=MagicMock())
+        for prefix in ("a", "b", "a", "b"):
+            _log_dummy_steps(logger)
+            logger.log_episode("task", True, viz_logging_prefix=prefix, extra=1.0)
+        defined = [c.args[0] for c in mock_define.call_args_list]
+        assert defined == ["a/*", "b/*"]
+
+
+class TestKeyCache:
+    def test_extra_kwargs_prefixed(self):
+        logger = EvalLogger(wandb_logger=MagicMock())
+        with patch("robot_eval_logger.eval_logger.wandb.define_metric"):
+            for i in range(2):
+                _log_dummy_steps(logger)
+                to_log = logger.log_episode("task", True, extra_metric=float(i))
+        assert to_log["task/extra_metric"] == 1.0
+        assert len(logger._key_cache) == 1
+
+
+class TestAsyncFrameRendering:
+    @patch("robot_eval_logger.eval_logger.wandb.define_metric")
+    def test_renders_logged_with_their_episode(self, _):
+        wandb_logger = MagicMock()
+        visualizer = MagicMock()
+        visualizer.log_frames.side_effect = lambda step, **kw: {"task/frames": step}
+        logger = EvalLogger(
+            wandb_logger=wandb_logger,
+            frames_visualizer=visualizer,
+            async_frame_rendering=True,
+        )
+        for _ in range(3):
+            _log_dummy_steps(logger)
+            to_log = logger.log_episode("task", True)
+            assert "task/frames" not in to_log
+        logger.flush()
+
+        logged = [c.args[0] for c in wandb_logger.log.call_args_list]
+        renders = [d for d in logged if "task/frames" in d]
+        assert [(d["task/frames"], d["num_episode"]) for d in renders] == [
+            (0, 0),
+            (1, 1),
+            (2, 2),
+        ]
+
+    @patch("robot_eval_logger.eval_logger.wandb.define_metric")
+    def test_success_rates_snapshot_passed_to_worker(self, _):
+        visualizer = MagicMock()
+        visualizer.log_frames.return_value = {}
+        logger = EvalLogger(
+            wandb_logger=MagicMock(),
+            frames_visualizer=visualizer,
+            async_frame_rendering=True,
+        )
+        _log_dummy_steps(logger)
+        logger.log_episode("task", True)
+        _log_dummy_steps(logger)
+        logger.log_episode("task", False)
+        logger.flush()
+        first_call = visualizer.log_frames.call_args_list[0]
+        assert first_call.kwargs["success_rates"] == [1.0]
+
+    @patch("robot_eval_logger.eval_logger.wandb.define_metric")
+    def test_only_plotted_success_tail_passed_to_worker(self, _):
+        visualizer = MagicMock()
+        visualizer.success_viz_every_n = 2
+        visualizer.log_frames.return_value = {}
+        logger = EvalLogger(
+            wandb_logger=MagicMock(),
+            frames_visualizer=visualizer,
+            async_frame_rendering=True,
+        )
+        for success in (True, False, True, True):
+            _log_dummy_steps(logger)
+            logger.log_episode("task", success)
+        logger.flush()
+        last_call = visualizer.log_frames.call_args_list[-1]
+        assert last_call.kwargs["success_rates"] == [1.0, 1.0]
+        assert logger.past_success_rates["task"] == [1.0, 0.0, 1.0, 1.0]
+
+    @patch("robot_eval_logger.eval_logger.wandb.define_metric")
+    def test_failed_render_does_not_block_saving(self, _):
+        wandb_logger, saver = MagicMock(), MagicMock()
+        visualizer = MagicMock()
+        visualizer.log_frames.side_effect = RuntimeError("render failed")
+        logger = EvalLogger(
+            wandb_logger=wandb_logger,
+            frames_visualizer=visualizer,
+            data_saver=saver,
+            async_frame_rendering=True,
+        )
+        for _ in range(2):
+            _log_dummy_steps(logger)
+            logger.log_episode("task", True)
+        logger.flush()
+
+        saved = [c.kwargs["i_episode"] for c in saver.save_episode.call_args_list]
+        assert saved == [0, 1]
+        saver.flush.assert_called_once()
+        assert logger.current_episode == 2
+        assert len(logger.past_success_rates["task"]) == 2
+        assert not any("task/frames" in c.args[0] for c in wandb_logger.log.mock_calls)
+
+    def test_storage_flushed_when_final_visualization_fails(self):
+        saver, visualizer = MagicMock(), MagicMock()
+        visualizer.log_remaining_frames.side_effect = RuntimeError("plot failed")
+        logger = EvalLogger(
+            wandb_logger=MagicMock(), frames_visualizer=visualizer, data_saver=saver
+        )
+        logger.__del__()
+        saver.flush.assert_called_once()
+
+
+class TestVisualizeRemainingFrames:
+    def test_skipped_when_nothing_buffered(self):
+        wandb_logger = MagicMock()
+        visualizer = MagicMock()
+        visualizer.pending_count = 0
+        logger = EvalLogger(wandb_logger=wandb_logger, frames_visualizer=visualizer)
+        logger._visualize_remaining_frames()
+        visualizer.log_remaining_frames.assert_not_called()
+        wandb_logger.log.assert_not_called()
+
+    def test_visualizer_without_pending_count(self):
+        wandb_logger, saver = MagicMock(), MagicMock()
+        visualizer = MagicMock(spec=["log_frames", "log_remaining_frames"])
+        visualizer.log_remaining_frames.return_value = {"task/frames": 0}
+        logger = EvalLogger(
+            wandb_logger=wandb_logger, frames_visualizer=visualizer, data_saver=saver
+        )
+        logger.__del__()
+        visualizer.log_remaining_frames.assert_called_once()
+        saver.flush.assert_called_once()
+
+
+class TestRank:
+    def test_non_zero_rank_is_a_no_op(self):
+        wandb_logger, saver, visualizer = MagicMock(), MagicMock(), MagicMock()
+        logger = EvalLogger(
+            wandb_logger=wandb_logger,
+            frames_visualizer=visualizer,
+            data_saver=saver,
+            log_step_stats_interval_minutes=1.0,
+            async_frame_rendering=True,
+            rank=1,
+        )
+        logger.save_metadata(
+            robot_name="r",
+            robot_type="widowx",
+            control_mode="joint_position",
+            action_frequency_hz=10.0,
+        )
+        _log_dummy_steps(logger)
+        assert logger.log_episode("task", True) == {}
+        logger.flush()
+        logger.__del__()
+
+        assert logger._time_logger is None
+        assert logger._render_executor is None
+        assert not logger.metadata_saved
+        assert logger.current_episode == 0
+        wandb_logger.log.assert_not_called()
+        saver.save_metadata.assert_not_called()
+        saver.save_episode.assert_not_called()
+        saver.flush.assert_not_called()
+        visualizer.log_frames.assert_not_called()
+
+    def test_del_after_failed_init(self):
+        # __init__ raised before any attribute was set
+        EvalLogger.__new__(EvalLogger).__del__()
@@ -0,0 +1,153 @@
+"""Tests for :mod:`robot_eval_logger.typing.eval_metadata`.
+
+How to run (from the repository root)::
+
+    python -m pytest tests/test_eval_metadata.py -v -o addopts=
+"""
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+import robot_eval_logger.typing.eval_metadata as metadata_module
+from robot_eval_logger.typing.eval_metadata import (
+    ControlMode,
+    EvalID,
+    MetaData,
+    RobotType,
+    TimeStamp,
+)
+
+
+def _fixed_timestamp():
+    ts = TimeStamp()
+    ts.timestamp = datetime(2025, 6, 1, 12, 0, 0)
+    return ts
+
+
+class TestTimeStamp:
+    def test_timestamp_roundtrips_through_ns(self):
+        ts = _fixed_timestamp()
+        ts.timestamp = datetime(2025, 6, 1, 12, 0, 0, 123456)
+        assert ts.timestamp == datetime(2025, 6, 1, 12, 0, 0, 123456)
+        assert str(ts) == "2025-06-01T12:00:00.123456"
+        assert ts.formatted("%Y%m%d") == "20250601"
+
+    def test_now_stored_as_int_ns(self):
+        before = datetime.now()
+        ts = TimeStamp()
+        assert isinstance(ts.ns, int)
+        assert before <= ts.timestamp <= datetime.now()
+        assert not hasattr(ts, "__dict__")
+
+
+class TestEvalID:
+    def test_same_inputs_same_id(self):
+        ts = _fixed_timestamp()
+        a = EvalID.create(ts, RobotType.WIDOWX, "eval")
+        b = EvalID.create(ts, RobotType.WIDOWX, "eval")
+        assert a.id == b.id
+        assert 0 <= a.id < 2**64
+
+    def test_ids_unchanged_across_versions(self):
+        # ids are persisted in metadata.json and run directory names
+        ts = _fixed_timestamp()
+        assert EvalID.create(ts, RobotType.WIDOWX, "eval").id == 6735574546123437936
+        assert EvalID.create(ts, "franka").id == 6772447669050749945
+
+    def test_inputs_change_id(self):
+        ts = _fixed_timestamp()
+        base = EvalID.create(ts, RobotType.WIDOWX, "eval")
+        assert EvalID.create(ts, RobotType.FRANKA, "eval").id != base.id
+        assert EvalID.create(ts, RobotType.WIDOWX, "other").id != base.id
+        assert EvalID.create(ts, RobotType.WIDOWX).id != base.id
+
+    def test_no_instance_dict(self):
+        ts = _fixed_timestamp()
+        assert not hasattr(ts, "__dict__")
+        assert not hasattr(EvalID.create(ts, RobotType.WIDOWX), "__dict__")
+
+    def test_stable_across_hash_seeds(self):
+        code = (
+            "from datetime import datetime\n"
+            "from robot_eval_logger.typing.eval_metadata import "
+            "EvalID, RobotType, TimeStamp\n"
+            "ts = TimeStamp()\n"
+            "ts.timestamp = datetime(2025, 6, 1, 12, 0, 0)\n"
+            "print(EvalID.create(ts, RobotType.WIDOWX, 'eval').id)\n"
+        )
+        ids = set()
+        for seed in ("1", "2"):
+            env = {**os.environ, "PYTHONHASHSEED": seed}
+            out = subprocess.run(
+                [sys.executable, "-c", code],
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            ids.add(int(out.stdout.strip()))
+        assert ids == {EvalID.create(_fixed_timestamp(), RobotType.WIDOWX, "eval").id}
+
+
+class TestMetaDataJson:
+    def _metadata(self, action_frequency_hz=10.0):
+        ts = _fixed_timestamp()
+        return MetaData(
+            eval_id=EvalID.create(ts, RobotType.WIDOWX, "eval"),
+            robot_name="test_robot",
+            robot_type=RobotType.WIDOWX,
+            control_mode=ControlMode.JOINT_POSITION,
+            action_frequency_hz=action_frequency_hz,
+            time=ts,
+            eval_name="eval",
+        )
+
+    def _assert_roundtrip(self, metadata, path):
+        metadata.save(path)
+        loaded = MetaData.load(path)
+        assert loaded.eval_id.id == metadata.eval_id.id
+        assert loaded.robot_type == RobotType.WIDOWX
+        assert loaded.control_mode == ControlMode.JOINT_POSITION
+        assert loaded.action_frequency_hz == 10.0
+        assert loaded.time.timestamp == metadata.time.timestamp
+        assert loaded.eval_name == "eval"
+
+    def test_roundtrip(self, tmp_path):
+        self._assert_roundtrip(self._metadata(), str(tmp_path / "metadata.json"))
+
+    def test_roundtrip_stdlib_json_fallback(self, tmp_path):
+        with patch.object(metadata_module, "orjson", None):
+            self._assert_roundtrip(self._metadata(), str(tmp_path / "metadata.json"))
+
+    @pytest.mark.skipif(metadata_module.orjson is None, reason="orjson not installed")
+    def test_numpy_scalars_serialized(self, tmp_path):
+        metadata = self._metadata(action_frequency_hz=np.float32(10.0))
+        self._assert_roundtrip(metadata, str(tmp_path / "metadata.json"))
+
+    def test_exclusive_refuses_existing_file(self, tmp_path):
+        path = str(tmp_path / "metadata.json")
+        self._metadata().save(path, exclusive=True)
+        with pytest.raises(FileExistsError):
+            self._metadata().save(path, exclusive=True)
+
+    def test_time_ns_saved_exactly(self, tmp_path):
+        path = str(tmp_path / "metadata.json")
+        metadata = self._metadata()
+        metadata.time.ns += 789  # sub-microsecond, lost by the ISO string
+        metadata.save(path)
+        assert MetaData.load(path).time.ns == metadata.time.ns
+
+    def test_loads_metadata_without_time_ns(self, tmp_path):
+        path = tmp_path / "metadata.json"
+        metadata = self._metadata()
+        metadata.save(str(path))
+        data = json.loads(path.read_text())
+        del data["time_ns"]
+        path.write_text(json.dumps(data))
+        assert MetaData.load(str(path)).time.timestamp == datetime(2025, 6, 1, 12)
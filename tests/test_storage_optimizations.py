@@ -26,7 +26,12 @@ import pytest
 
 from robot_eval_logger.storage.base_saver import StorageConfig
 from robot_eval_logger.storage.local import LocalStorage
-from robot_eval_logger.typing.traj_data import _LZ4_MAGIC, TrajData
+from robot_eval_logger.typing.traj_data import (
+    _LZ4_MAGIC,
+    StepData,
+    TrajData,
+    step_data_sequence_to_traj_data,
+)
 
 # ---------------------------------------------------------------------------
 # StorageConfig defaults & customization
@@ -41,6 +46,7 @@ class TestStorageConfig:
         assert cfg.compress_pickle is True
         assert cfg.use_highest_pickle_protocol is True
         assert cfg.async_saving is True
+        assert cfg.image_format == "jpeg"
 
     def test_individual_toggle(self):
         cfg = StorageConfig(compress_images=False, async_saving=False)
@@ -88,6 +94,9 @@ class TestImageCompression:
         for cam in sample_traj_data.obs:
             assert cam in decoded
             assert len(decoded[cam]) == len(sample_traj_data.obs[cam])
+            # stacked, matching what an uncompressed save loads as
+            assert isinstance(decoded[cam], np.ndarray)
+            assert decoded[cam].shape == np.shape(sample_traj_data.obs[cam])
             for orig, dec in zip(sample_traj_data.obs[cam], decoded[cam]):
                 assert isinstance(dec, np.ndarray)
                 assert dec.shape == orig.shape
@@ -100,6 +109,15 @@ class TestImageCompression:
             for orig, dec in zip(sample_traj_data.obs[cam], result[cam]):
                 np.testing.assert_array_equal(orig, dec)
 
+    def test_decode_images_passes_stacked_array_through(self):
+        stacked = np.zeros((3, 8, 8, 3), dtype=np.uint8)
+        assert TrajData.decode_images({"cam": stacked})["cam"] is stacked
+
+    def test_decode_images_keeps_unstackable_frames_as_list(self):
+        frames = [np.zeros((8, 8, 3), np.uint8), np.zeros((4, 4, 3), np.uint8)]
+        decoded = TrajData.decode_images({"cam": frames})["cam"]
+        assert isinstance(decoded, list) and len(decoded) == 2
+
     def test_no_compression_keeps_ndarray(self, sample_traj_data, tmp_path):
         path = str(tmp_path / "traj.pkl")
         sample_traj_data.save(path, compress_images=False)
@@ -108,6 +126,49 @@ class TestImageCompression:
             for img in img_list:
                 assert isinstance(img, np.ndarray)
 
+    def test_pillow_fallback_roundtrip(self, sample_traj_data, tmp_path):
+        """Without simplejpeg, images are encoded and decoded with Pillow."""
+        path = str(tmp_path / "traj.pkl")
+        with patch("robot_eval_logger.typing.traj_data.simplejpeg", None):
+            sample_traj_data.save(path, compress_images=True)
+            decoded = TrajData.decode_images(TrajData.load(path).obs)
+        for cam in sample_traj_data.obs:
+            for orig, dec in zip(sample_traj_data.obs[cam], decoded[cam]):
+                assert dec.shape == orig.shape
+
+    def test_decode_grayscale_jpeg(self, tmp_path):
+        gray = np.full((32, 32), 128, dtype=np.uint8)
+        traj = TrajData(language_command="x", success=True, obs={"cam": [gray]})
+        path = str(tmp_path / "traj.pkl")
+        traj.save(path, compress_images=True)
+        decoded = TrajData.decode_images(TrajData.load(path).obs)
+        assert decoded["cam"][0].shape == (32, 32)
+
+    def test_png_roundtrip_lossless(self, sample_traj_data, tmp_path):
+        path = str(tmp_path / "traj.pkl")
+        sample_traj_data.save(path, compress_images=True, image_format="png")
+        loaded = TrajData.load(path)
+        assert loaded.obs["image_primary"][0][:8] == b"\x89PNG\r\n\x1a\n"
+        decoded = TrajData.decode_images(loaded.obs)
+        for cam in sample_traj_data.obs:
+            for orig, dec in zip(sample_traj_data.obs[cam], decoded[cam]):
+                np.testing.assert_array_equal(orig, dec)
+
+    def test_local_storage_uses_configured_format(self, sample_traj_data, tmp_path):
+        cfg = StorageConfig(image_format="png", async_saving=False)
+        storage = LocalStorage(str(tmp_path), config=cfg)
+        storage.make_eval_id_and_timestamp("widowx", "test_eval")
+        storage.make_save_dir()
+        path = storage.save_episode(0, sample_traj_data)
+        blob = TrajData.load(path).obs["image_primary"][0]
+        assert blob[:8] == b"\x89PNG\r\n\x1a\n"
+
+    def test_unknown_image_format_rejected(self, sample_traj_data, tmp_path):
+        with pytest.raises(ValueError, match="image_format"):
+            sample_traj_data.save(
+                str(tmp_path / "traj.pkl"), compress_images=True, image_format="bmp"
+            )
+
     def test_lower_quality_smaller_file(self, sample_traj_data, tmp_path):
         path_q95 = str(tmp_path / "q95.pkl")
         path_q30 = str(tmp_path / "q30.pkl")
@@ -153,6 +214,28 @@ class TestArrayStacking:
         assert isinstance(loaded.action, list)
         assert len(loaded.action) == 5
 
+    def test_step_sequence_built_stacked(self, rng):
+        steps = [
+            StepData(
+                obs={"cam": rng.integers(0, 256, (8, 8, 3), dtype=np.uint8)},
+                action=rng.standard_normal(7).astype(np.float32),
+                joint_position=np.zeros(7, dtype=np.float32),
+                joint_velocity=np.zeros(7, dtype=np.float32),
+                end_effector_pose=np.zeros(7, dtype=np.float32),
+                gripper=np.zeros(1, dtype=np.float32),
+                joint_effort=np.zeros(7, dtype=np.float32) if t else None,
+            )
+            for t in range(4)
+        ]
+        traj = step_data_sequence_to_traj_data(steps)
+        assert traj.obs["cam"].shape == (4, 8, 8, 3)
+        assert traj.action.shape == (4, 7)
+        assert traj.action.dtype == np.float32
+        assert traj.gripper.shape == (4, 1)
+        np.testing.assert_array_equal(traj.action[2], steps[2].action)
+        # partially-missing fields cannot be stacked and stay per-step lists
+        assert isinstance(traj.joint_effort, list)
+
     def test_original_data_unchanged(self, sample_traj_data, tmp_path):
         """save() with stack_arrays should not mutate the original TrajData."""
         path = str(tmp_path / "traj.pkl")
@@ -220,6 +303,13 @@ class TestPickleProtocol:
         used_protocol = proto_byte[1]
         assert used_protocol == pickle.HIGHEST_PROTOCOL
 
+    def test_highest_protocol_by_default(self, sample_traj_data, tmp_path):
+        path = str(tmp_path / "traj.pkl")
+        sample_traj_data.save(path)
+        with open(path, "rb") as f:
+            proto_byte = f.read(2)
+        assert proto_byte[1] == pickle.HIGHEST_PROTOCOL
+
     def test_default_protocol(self, sample_traj_data, tmp_path):
         path = str(tmp_path / "traj.pkl")
         sample_traj_data.save(
@@ -330,6 +420,20 @@ class TestAsyncSaving:
         with pytest.raises(IOError, match="disk full"):
             storage.flush()
 
+    def test_finished_saves_reaped_errors_kept(self, sample_traj_data, tmp_path):
+        storage = self._make_storage(tmp_path, async_on=True)
+        bad_traj = MagicMock()
+        bad_traj.save.side_effect = IOError("disk full")
+
+        storage.save_episode(0, bad_traj)
+        storage._pending_futures[0].exception()  # wait for the failed save
+        storage.save_episode(1, sample_traj_data)
+        assert len(storage._pending_futures) == 1
+        assert len(storage._save_errors) == 1
+        with pytest.raises(IOError, match="disk full"):
+            storage.flush()
+        assert storage._save_errors == []
+
     def test_config_flags_passed_to_traj_save(self, sample_traj_data, tmp_path):
         cfg = StorageConfig(
             compress_images=True,
@@ -416,7 +520,7 @@ class TestBatchHfUploads:
             mock_commit.assert_called_once()
             args, kwargs = mock_commit.call_args
             assert len(kwargs["operations"]) == 3
-            assert "3 episodes" in kwargs["commit_message"]
+            assert "3 episodes (0-2)" in kwargs["commit_message"]
 
     def test_flush_clears_queue(self, hf_storage, sample_traj_data):
         with patch.object(hf_storage.api, "create_commit"):
@@ -428,6 +532,8 @@ class TestBatchHfUploads:
         with patch.object(hf_storage_no_batch.api, "upload_file") as mock_upload:
             hf_storage_no_batch.save_episode(0, sample_traj_data)
             mock_upload.assert_called_once()
+            path = mock_upload.call_args.kwargs["path_or_fileobj"]
+            assert isinstance(path, str) and path.endswith("traj_0.pkl")
 
     def test_batch_fallback_on_commit_failure(self, hf_storage, sample_traj_data):
         with patch.object(
@@ -441,6 +547,75 @@ class TestBatchHfUploads:
                 hf_storage.flush()
                 assert mock_individual.call_count == 2
 
+    def test_missing_repo_not_retried(self, hf_storage_no_batch, sample_traj_data):
+        from huggingface_hub.errors import RepositoryNotFoundError
+
+        err = RepositoryNotFoundError("404 repo missing", response=MagicMock())
+        with patch.object(
+            hf_storage_no_batch.api, "upload_file", side_effect=err
+        ) as mock_upload, patch(
+            "robot_eval_logger.storage.hugging_face.time.sleep"
+        ) as mock_sleep:
+            hf_storage_no_batch.save_episode(0, sample_traj_data)
+            hf_storage_no_batch.save_episode(1, sample_traj_data)
+            mock_upload.assert_called_once()
+            mock_sleep.assert_not_called()
+        assert os.path.exists(os.path.join(hf_storage_no_batch.run_dir, "traj_1.pkl"))
+
+    def test_batch_size_triggers_commit(self, hf_storage, sample_traj_data):
+        hf_storage.config.hf_batch_size = 2
+        with patch.object(hf_storage.api, "create_commit") as mock_commit:
+            hf_storage.save_episode(0, sample_traj_data)
+            mock_commit.assert_not_called()
+            hf_storage.save_episode(1, sample_traj_data)
+            mock_commit.assert_called_once()
+            assert len(hf_storage._pending_hf_uploads) == 0
+            hf_storage.save_episode(2, sample_traj_data)
+            hf_storage.flush()
+            assert mock_commit.call_count == 2
+            assert len(mock_commit.call_args.kwargs["operations"]) == 1
+
+    def test_batch_interval_triggers_commit(self, hf_storage, sample_traj_data):
+        hf_storage.config.hf_batch_interval_s = 30.0
+        time_path = "robot_eval_logger.storage.hugging_face.time.time"
+        with patch.object(hf_storage.api, "create_commit") as mock_commit:
+            with patch(time_path, return_value=100.0):
+                hf_storage.save_episode(0, sample_traj_data)
+            with patch(time_path, return_value=120.0):
+                hf_storage.save_episode(1, sample_traj_data)
+            mock_commit.assert_not_called()
+            with patch(time_path, return_value=131.0):
+                hf_storage.save_episode(2, sample_traj_data)
+            mock_commit.assert_called_once()
+            assert len(mock_commit.call_args.kwargs["operations"]) == 3
+
+    def test_async_batch_commit_after_local_saves(self, tmp_path, sample_traj_data):
+        from robot_eval_logger.storage.hugging_face import HuggingFaceStorage
+
+        cfg = StorageConfig(
+            compress_images=False,
+            async_saving=True,
+            batch_hf_uploads=True,
+            hf_batch_size=2,
+        )
+        storage = HuggingFaceStorage(
+            storage_dir=str(tmp_path), repo_id="fake/repo", config=cfg
+        )
+        storage.make_eval_id_and_timestamp("widowx", "test_eval")
+        storage.make_save_dir()
+
+        def _check_files_exist(**kwargs):
+            for op in kwargs["operations"]:
+                assert os.path.exists(op.path_or_fileobj)
+
+        with patch.object(
+            storage.api, "create_commit", side_effect=_check_files_exist
+        ) as mock_commit:
+            storage.save_episode(0, sample_traj_data)
+            storage.save_episode(1, sample_traj_data)
+            storage.flush()
+            mock_commit.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # EvalLogger.flush() integration
@@ -463,6 +638,30 @@ class TestEvalLoggerFlush:
         logger.flush()  # should not raise
 
 
+class TestSaveMetadata:
+    def _save(self, storage):
+        return storage.save_metadata(
+            robot_name="test_robot",
+            robot_type="widowx",
+            control_mode="joint_position",
+            action_frequency_hz=10.0,
+            eval_name="test_eval",
+        )
+
+    def test_second_save_to_same_run_dir_raises(self, tmp_path):
+        storage = LocalStorage(str(tmp_path))
+        path = self._save(storage)
+        with open(path) as f:
+            original = f.read()
+
+        # simulate a second evaluator landing on the same eval_id
+        with patch.object(storage, "make_eval_id_and_timestamp"):
+            with pytest.raises(ValueError, match="already exists"):
+                self._save(storage)
+        with open(path) as f:
+            assert f.read() == original
+
+
 # ---------------------------------------------------------------------------
 # Backward compatibility
 # ---------------------------------------------------------------------------
@@ -4,7 +4,6 @@ How to run (from the repository root)::
 
     python -m pytest tests/test_time_logger.py -v -o addopts=
 """
-import time
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -77,6 +76,15 @@ class TestTimeLoggerLogStats:
         assert tl.steps_since_last_log == 0
         assert tl.time_elapsed == pytest.approx(1.0)
 
+    @patch("robot_eval_logger.time.time_logger.wandb.define_metric")
+    def test_metric_defined_only_once(self, mock_define):
+        tl = TimeLogger(MagicMock(), interval_minutes=1.0)
+        for t in (0.0, 60.0, 120.0, 180.0):
+            with patch("robot_eval_logger.time.time_logger.time.time", return_value=t):
+                tl._log_stats()
+        assert tl._wandb_logger.log.call_count == 3
+        mock_define.assert_called_once()
+
     @patch("robot_eval_logger.time.time_logger.wandb.define_metric")
     def test_zero_minutes_elapsed_yields_zero_steps_per_minute(self, mock_define):
         wandb_mock = MagicMock()
@@ -92,41 +100,67 @@ class TestTimeLoggerLogStats:
         assert payload["step_stats/total_eval_steps"] == 2
 
 
-class TestTimeLoggerThreading:
+class TestTimeLoggerInlineLogging:
+    _TIME = "robot_eval_logger.time.time_logger.time.time"
+
     def test_stop_without_start_is_safe(self):
         tl = TimeLogger(MagicMock(), interval_minutes=1.0)
         tl.stop()
 
+    def test_no_logging_before_start(self):
+        wandb_mock = MagicMock()
+        tl = TimeLogger(wandb_mock, interval_minutes=0.0)
+        tl.record_step()
+        wandb_mock.log.assert_not_called()
+        assert tl.total_steps == 1
+
     def test_start_is_idempotent(self):
         wandb_mock = MagicMock()
         tl = TimeLogger(wandb_mock, interval_minutes=60.0)
-        tl.start()
-        first = tl._thread
-        assert first is not None
-        tl.start()
-        assert tl._thread is first
-        tl.stop()
-        assert tl._thread is None
+        with patch(self._TIME, return_value=100.0):
+            tl.start()
+        with patch(self._TIME, return_value=200.0):
+            tl.start()
+        assert tl.last_log_time == 100.0
+        wandb_mock.log.assert_not_called()
 
-    def test_stop_joins_background_thread(self):
+    @patch("robot_eval_logger.time.time_logger.wandb.define_metric")
+    def test_record_step_logs_once_interval_elapsed(self, mock_define):
         wandb_mock = MagicMock()
-        tl = TimeLogger(wandb_mock, interval_minutes=60.0)
+        tl = TimeLogger(wandb_mock, interval_minutes=1.0)
+        with patch(self._TIME, return_value=0.0):
+            tl.start()
+        with patch(self._TIME, return_value=59.0):
+            tl.record_step()
+        wandb_mock.log.assert_not_called()
+        with patch(self._TIME, return_value=60.0):
+            tl.record_step()
+        wandb_mock.log.assert_called_once()
+        payload = wandb_mock.log.call_args[0][0]
+        assert payload["step_stats/total_eval_steps"] == 2
+        assert payload["step_stats/eval_steps_per_minute"] == pytest.approx(2.0)
+        assert tl.steps_since_last_log == 0
+
+    @patch("robot_eval_logger.time.time_logger.wandb.define_metric")
+    def test_stop_prevents_logging(self, mock_define):
+        wandb_mock = MagicMock()
+        tl = TimeLogger(wandb_mock, interval_minutes=0.0)
         tl.start()
-        time.sleep(0.1)
         tl.stop()
-        assert tl._thread is None
+        tl.record_step()
+        wandb_mock.log.assert_not_called()
 
     @patch("robot_eval_logger.time.time_logger.wandb.define_metric")
-    def test_wandb_log_error_exits_loop(self, mock_define):
+    def test_wandb_log_error_stops_logging(self, mock_define):
         wandb_mock = MagicMock()
         wandb_mock.log.side_effect = RuntimeError("wandb unavailable")
 
         tl = TimeLogger(wandb_mock, interval_minutes=0.0)
-        with patch("robot_eval_logger.time.time_logger.time.time", return_value=900.0):
-            tl.start()
-        time.sleep(0.2)
-        tl.stop()
-        wandb_mock.log.assert_called()
+        tl.start()
+        tl.record_step()
+        tl.record_step()
+        wandb_mock.log.assert_called_once()
+        assert tl.total_steps == 2
 
 
 class TestEvalLoggerTimeLogging:
@@ -0,0 +1,43 @@
+"""Tests for :mod:`robot_eval_logger.utils`.
+
+How to run (from the repository root)::
+
+    python -m pytest tests/test_utils.py -v -o addopts=
+"""
+from unittest.mock import patch
+
+import pytest
+
+from robot_eval_logger.utils import Timer
+
+
+class TestTimer:
+    def test_times_reported_in_seconds(self):
+        timer = Timer()
+        clock = iter([0, 1_500_000_000, 2_000_000_000, 2_500_000_000])
+        with patch(
+            "robot_eval_logger.utils.time.perf_counter_ns",
+            side_effect=lambda: next(clock),
+        ):
+            with timer.context("step"):
+                pass
+            with timer.context("step"):
+                pass
+        assert timer.get_times("step", reset=False) == pytest.approx(2.0)
+        assert timer.get_average_times() == {"step": pytest.approx(1.0)}
+        assert timer.get_average_times() == {}
+
+    def test_tock_without_tick_raises(self):
+        with pytest.raises(ValueError, match="not ticking"):
+            Timer().tock("step")
+
+    def test_double_tick_raises(self):
+        timer = Timer()
+        timer.tick("step")
+        with pytest.raises(ValueError, match="already ticking"):
+            timer.tick("step")
+
+    def test_no_instance_dict(self):
+        timer = Timer()
+        assert not hasattr(timer, "__dict__")
+        assert not hasattr(timer.context("step"), "__dict__")
@@ -0,0 +1,245 @@
+"""Tests for :class:`robot_eval_logger.visualize.FrameVisualizer`.
+
+How to run (from the repository root)::
+
+    python -m pytest tests/test_visualize_frames.py -v -o addopts=
+"""
+from unittest.mock import patch
+
+import cv2
+import imageio_ffmpeg
+import numpy as np
+import pytest
+
+from robot_eval_logger.visualize import FrameVisualizer
+
+
+def _dummy_frames(n=12, size=(32, 32)):
+    return [np.zeros((*size, 3), dtype=np.uint8) for _ in range(n)]
+
+
+class TestFrameStrip:
+    def test_each_frame_resized_once(self):
+        viz = FrameVisualizer(
+            video_frame_size=(16, 16),
+            episode_viz_frame_interval=5,
+            periodic_log_initial_and_final_frames=False,
+        )
+        with patch(
+            "cv2.resize",
+            wraps=cv2.resize,
+        ) as mock_resize, patch("wandb.Image") as mock_image:
+            viz.log_frames(step=0, logging_prefix="task", frames=_dummy_frames(12))
+        assert mock_resize.call_count == 12
+        # frames 0, 5, 10 plus the final frame
+        assert mock_image.call_args.args[0].shape == (16, 4 * 16, 3)
+
+    def test_frames_at_target_size_not_resized(self):
+        viz = FrameVisualizer(
+            video_frame_size=(32, 32), periodic_log_initial_and_final_frames=False
+        )
+        with patch("cv2.resize", wraps=cv2.resize) as mock_resize:
+            logged = viz.log_frames(
+                step=0, logging_prefix="task", frames=_dummy_frames(12)
+            )
+        mock_resize.assert_not_called()
+        assert "task/video" in logged
+
+    def test_accepts_stacked_array(self):
+        viz = FrameVisualizer(
+            video_frame_size=(16, 16),
+            episode_viz_frame_interval=5,
+            periodic_log_initial_and_final_frames=False,
+        )
+        frames = np.stack(_dummy_frames(12))
+        with patch("wandb.Image") as mock_image:
+            logged = viz.log_frames(step=0, logging_prefix="task", frames=frames)
+        assert "task/video" in logged
+        assert mock_image.call_args.args[0].shape == (16, 4 * 16, 3)
+
+
+class TestWriteVideo:
+    def test_all_frames_written(self, tmp_path):
+        path = str(tmp_path / "video.mp4")
+        FrameVisualizer()._write_video(_dummy_frames(7), path)
+        reader = imageio_ffmpeg.read_frames(path)
+        meta = next(reader)
+        assert meta["size"] == (32, 32)
+        assert sum(1 for _ in reader) == 7
+
+
+class TestPastFrames:
+    def test_initial_and_final_frames_stored_small(self):
+        viz = FrameVisualizer(video_frame_size=(16, 8), media_log_every_n=100)
+        frames = np.stack(_dummy_frames(12, size=(64, 48)))
+        frames[-1] = 255
+        # step 1 skips the media path, so only the first/last frames are resized
+        viz.log_frames(step=1, logging_prefix="task", frames=frames)
+        initial, final = viz.past_frames["task"].get()
+        assert initial.shape == final.shape == (1, 8, 16, 3)
+        assert final.min() == 255
+        assert not np.shares_memory(initial, frames)
+
+    def test_copies_frames_already_at_target_size(self):
+        viz = FrameVisualizer(video_frame_size=(32, 32), media_log_every_n=100)
+        frames = np.stack(_dummy_frames(4))
+        viz.log_frames(step=1, logging_prefix="task", frames=frames)
+        initial, _ = viz.past_frames["task"].get()
+        assert not np.shares_memory(initial, frames)
+
+    def test_ring_buffer_keeps_latest_episodes_in_order(self):
+        viz = FrameVisualizer(
+            video_frame_size=(4, 4),
+            success_viz_every_n=3,
+            media_log_every_n=100,
+            periodic_log_initial_and_final_frames=False,  # never cleared
+        )
+        for i in range(5):
+            frames = np.full((2, 4, 4, 3), i, dtype=np.uint8)
+            frames[-1] += 100
+            viz.log_frames(step=i, logging_prefix="task", frames=frames)
+        initial, final = viz.past_frames["task"].get()
+        assert len(viz.past_frames["task"]) == 3
+        assert initial[:, 0, 0, 0].tolist() == [2, 3, 4]
+        assert final[:, 0, 0, 0].tolist() == [102, 103, 104]
+
+
+class TestSuccessPlot:
+    def _frames(self, n):
+        frames = np.zeros((n, 16, 16, 3), dtype=np.uint8)
+        return {"initial_frames": frames, "final_frames": frames}
+
+    def test_cv2_plot_below_frame_mosaic(self):
+        viz = FrameVisualizer()
+        img = viz._plot_frames_with_success(
+            **self._frames(4), past_success_rates=[1, 0, 1, 1], step=7
+        )
+        assert img.dtype == np.uint8
+        assert img.shape[1] == 4 * 16 and img.shape[2] == 3
+        assert img.shape[0] > 2 * 16
+        np.testing.assert_array_equal(img[: 2 * 16], 0)  # frames on top
+
+    def test_cv2_plot_tolerates_short_success_history(self):
+        viz = FrameVisualizer()
+        img = viz._plot_frames_with_success(
+            **self._frames(3), past_success_rates=[1.0], step=2
+        )
+        assert img.shape[1] == 3 * 16
+
+    def test_matplotlib_backend(self):
+        viz = FrameVisualizer(success_plot_backend="matplotlib")
+        img = viz._plot_frames_with_success(
+            **self._frames(2), past_success_rates=[0, 1], step=1
+        )
+        assert img.dtype == np.uint8 and img.ndim == 3 and img.shape[2] == 3
+
+    def test_matplotlib_figure_reused(self):
+        from matplotlib import pyplot as plt
+
+        viz = FrameVisualizer(success_plot_backend="matplotlib")
+        first = viz._plot_frames_with_success(
+            **self._frames(2), past_success_rates=[0, 1], step=1
+        )
+        fig = viz._success_plot_figure
+        second = viz._plot_frames_with_success(
+            **self._frames(2), past_success_rates=[0, 1], step=1
+        )
+        assert viz._success_plot_figure is fig
+        np.testing.assert_array_equal(first, second)  # axes cleared between plots
+        assert plt.get_fignums() == []  # nothing left open in pyplot
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError, match="success_plot_backend"):
+            FrameVisualizer(success_plot_backend="svg")
+
+
+class TestMediaLogEveryN:
+    def test_media_only_logged_every_n_episodes(self):
+        viz = FrameVisualizer(
+            video_frame_size=(16, 16),
+            periodic_log_initial_and_final_frames=False,
+            media_log_every_n=2,
+        )
+        logged = [
+            viz.log_frames(step=i, logging_prefix="task", frames=_dummy_frames())
+            for i in range(4)
+        ]
+        assert set(logged[0]) == {"task/frames", "task/video"}
+        assert logged[1] == {}
+        assert set(logged[2]) == {"task/frames", "task/video"}
+        assert logged[3] == {}
+
+    @pytest.mark.parametrize("n", [0, -1])
+    def test_non_positive_interval_rejected(self, n):
+        with pytest.raises(ValueError, match="media_log_every_n"):
+            FrameVisualizer(media_log_every_n=n)
+
+    def test_skipped_episodes_still_feed_periodic_summary(self):
+        viz = FrameVisualizer(
+            video_frame_size=(16, 16),
+            success_viz_every_n=3,
+            media_log_every_n=100,
+        )
+        for i in range(3):
+            logged = viz.log_frames(
+                step=i,
+                logging_prefix="task",
+                frames=_dummy_frames(),
+                success_rates=[1.0] * (i + 1),
+            )
+        assert "task/initial_and_final_frames" in logged
+        assert "task/video" not in logged
+
+
+class TestImageFileType:
+    @pytest.mark.parametrize("file_type", ["jpg", "png"])
+    def test_images_encoded_with_configured_file_type(self, file_type):
+        viz = FrameVisualizer(
+            video_frame_size=(16, 16),
+            success_viz_every_n=1,
+            image_file_type=file_type,
+        )
+        with patch("wandb.Image") as mock_image:
+            viz.log_frames(
+                step=0,
+                logging_prefix="task",
+                frames=_dummy_frames(),
+                success_rates=[1.0],
+            )
+        assert mock_image.call_count == 2
+        assert all(c.kwargs["file_type"] == file_type for c in mock_image.mock_calls)
+
+    def test_unknown_file_type_rejected(self):
+        with pytest.raises(ValueError, match="image_file_type"):
+            FrameVisualizer(image_file_type="webp")
+
+
+class TestLogRemainingFrames:
+    def test_remaining_frames_logged_once(self):
+        viz = FrameVisualizer(video_frame_size=(16, 16), success_viz_every_n=3)
+        viz.log_frames(step=0, logging_prefix="task", frames=_dummy_frames())
+        logged = viz.log_remaining_frames(final_step=0, success_rates={"task": [1.0]})
+        assert "task/initial_and_final_frames" in logged
+        assert viz.pending_count == 0
+        assert viz.log_remaining_frames(final_step=0) == {}
+
+
+class TestPendingCount:
+    def test_counts_buffered_episodes_until_periodic_log(self):
+        viz = FrameVisualizer(video_frame_size=(16, 16), success_viz_every_n=3)
+        assert viz.pending_count == 0
+        for i in range(2):
+            viz.log_frames(
+                step=i,
+                logging_prefix="task",
+                frames=_dummy_frames(),
+                success_rates=[1.0] * (i + 1),
+            )
+        assert viz.pending_count == 2
+        viz.log_frames(
+            step=2,
+            logging_prefix="task",
+            frames=_dummy_frames(),
+            success_rates=[1.0] * 3,
+        )
+        assert viz.pending_count == 0
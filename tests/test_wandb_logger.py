@@ -0,0 +1,49 @@
+"""Tests for :mod:`robot_eval_logger.visualize.wandb`.
+
+How to run (from the repository root)::
+
+    python -m pytest tests/test_wandb_logger.py -v -o addopts=
+"""
+from unittest.mock import patch
+
+from robot_eval_logger.visualize.wandb import (
+    WandBLogger,
+    _recursive_flatten_dict,
+    generate_random_string,
+)
+
+
+class TestFlattenDict:
+    def test_nested_keys_joined(self):
+        data = {"a": {"b": 1, "c": {"d": 2}}, "e": 3}
+        assert _recursive_flatten_dict(data) == {"a/b": 1, "a/c/d": 2, "e": 3}
+
+    def test_flat_dict_unchanged(self):
+        data = {"task/success": 1.0, "num_episode": 4}
+        assert _recursive_flatten_dict(data) == data
+
+    def test_log_passes_flat_dict(self):
+        logger = WandBLogger.__new__(WandBLogger)  # skip wandb.init
+        with patch("robot_eval_logger.visualize.wandb.wandb.log") as mock_log:
+            logger.log({"task": {"success": 1.0}, "num_episode": 0}, step=3)
+        mock_log.assert_called_once_with(
+            {"task/success": 1.0, "num_episode": 0}, step=3
+        )
+
+
+class TestGenerateRandomString:
+    def test_format(self):
+        for length in (1, 6, 12):
+            s = generate_random_string(length)
+            assert s.startswith("rnd")
+            assert len(s) == 3 + length
+            assert s[3:].isdigit()
+
+    def test_independent_of_global_random_seed(self):
+        import random
+
+        random.seed(0)
+        a = generate_random_string(12)
+        random.seed(0)
+        b = generate_random_string(12)
+        assert a != b